@@ -49,6 +49,12 @@ def main() -> int:
         action="store_true",
         help="Disable access logging (reduces I/O on Pi)",
     )
+    parser.add_argument(
+        "--loop",
+        default="auto",
+        choices=["auto", "asyncio", "uvloop"],
+        help="Event loop implementation (default: auto, uses uvloop if installed)",
+    )
     parser.add_argument(
         "--limit-concurrency",
         type=int,
@@ -85,6 +91,7 @@ def main() -> int:
         "reload": args.reload,
         "log_level": args.log_level.lower(),
         "access_log": not args.no_access_log,
+        "loop": args.loop,
     }
 
     # Add concurrency limit if specified (helps on Pi)
@@ -15,7 +15,7 @@ from quart_cors import cors
 from ..config import load_config
 from ..core.controller import IcemakerController
 from ..core.events import Event, EventType
-from ..hal.base import SensorName
+from ..core.states import IcemakerState
 from .websocket import WebSocketManager
 
 logger = logging.getLogger(__name__)
@@ -76,7 +76,6 @@ class AppState:
     controller: Optional[IcemakerController] = None
     ws_manager: WebSocketManager = field(default_factory=WebSocketManager)
     _controller_task: Optional[asyncio.Task] = None
-    _sensor_task: Optional[asyncio.Task] = None
     _shutdown_event: asyncio.Event = field(default_factory=asyncio.Event)
     startup_commit: Optional[str] = None  # Git commit at server startup
 
@@ -90,21 +89,17 @@ def _get_target_temp_for_state(state: str) -> float | None:
     controller = app_state.controller
     if controller is None:
         return None
-    cfg = controller.config
-    ctx = controller.fsm.context
-
-    target = None
-    if state == "CHILL":
-        if ctx.chill_mode == "rechill":
-            target = cfg.rechill.target_temp
-        else:
-            target = cfg.prechill.target_temp
-    elif state == "ICE":
-        target = cfg.ice_making.target_temp
-    elif state == "HEAT":
-        target = cfg.harvest.target_temp
-
-    logger.debug("_get_target_temp_for_state(%s) -> %s (harvest=%s)", state, target, cfg.harvest.target_temp)
+    try:
+        target = controller.target_temp_for_state(IcemakerState[state])
+    except KeyError:
+        return None
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "_get_target_temp_for_state(%s) -> %s",
+            state,
+            target,
+        )
     return target
 
 
@@ -129,17 +124,32 @@ async def _event_handler(event: Event) -> None:
             cycle_count=ctx.cycle_count,
             session_cycle_count=ctx.session_cycle_count,
             time_in_state=fsm.time_in_state(),
-            chill_mode=ctx.chill_mode,
+            chill_mode=ctx.chill_mode.label if ctx.chill_mode is not None else None,
         )
 
     elif event.type == EventType.TEMP_READING:
+        controller = app_state.controller
+        fsm = controller.fsm
+
+        # Get simulator data from thermal model if available
+        water_temp = None
+        simulated_time = None
+        if controller._thermal_model is not None:
+            water_temp = controller._thermal_model.get_water_temp()
+            simulated_time = controller._thermal_model.get_simulated_time()
+
         await app_state.ws_manager.broadcast_temp_update(
-            plate_temp=event.data.get("plate_temp", 0.0),
-            bin_temp=event.data.get("bin_temp", 0.0),
+            event.data.get("plate_temp", 0.0),
+            event.data.get("bin_temp", 0.0),
+            water_temp,
+            fsm.context.target_temp,
+            simulated_time,
+            fsm.time_in_state(),
         )
 
-    elif event.type == EventType.RELAY_CHANGED:
-        # Get all relay states and broadcast
+    elif event.type in (EventType.RELAY_CHANGED, EventType.EMERGENCY_STOP):
+        # Get all relay states and broadcast (emergency stop switches all
+        # relays off without emitting per-relay events)
         if app_state.controller and app_state.controller.gpio:
             relay_states = await app_state.controller.gpio.get_all_relays()
             await app_state.ws_manager.broadcast_relay_update({
@@ -153,53 +163,6 @@ async def _event_handler(event: Event) -> None:
         )
 
 
-async def _poll_sensors_loop() -> None:
-    """Background task to poll temperature sensors."""
-    controller = app_state.controller
-    if controller is None or controller.sensors is None:
-        return
-
-    logger.info("Sensor polling started")
-    while not app_state._shutdown_event.is_set():
-        try:
-            temps = await controller.sensors.read_all_temperatures()
-            controller.fsm.context.plate_temp = temps.get(SensorName.PLATE, 70.0)
-            controller.fsm.context.bin_temp = temps.get(SensorName.ICE_BIN, 70.0)
-
-            # Get simulator data from thermal model if available
-            water_temp = None
-            simulated_time = None
-            if controller._thermal_model is not None:
-                water_temp = controller._thermal_model.get_water_temp()
-                simulated_time = controller._thermal_model.get_simulated_time()
-
-            # Broadcast temperature update via WebSocket
-            await app_state.ws_manager.broadcast_temp_update(
-                controller.fsm.context.plate_temp,
-                controller.fsm.context.bin_temp,
-                water_temp,
-                controller.fsm.context.target_temp,
-                simulated_time,
-                controller.fsm.time_in_state(),
-            )
-
-        except asyncio.CancelledError:
-            break
-        except Exception as e:
-            logger.error("Sensor polling error: %s", e)
-
-        try:
-            await asyncio.wait_for(
-                app_state._shutdown_event.wait(),
-                timeout=controller.config.poll_interval,
-            )
-            break  # Shutdown requested
-        except asyncio.TimeoutError:
-            pass  # Normal timeout, continue polling
-
-    logger.info("Sensor polling stopped")
-
-
 async def _shutdown_tasks() -> None:
     """Clean up all background tasks."""
     logger.info("Shutting down icemaker API")
@@ -227,13 +190,9 @@ async def _shutdown_tasks() -> None:
         except (asyncio.CancelledError, asyncio.TimeoutError):
             pass
 
-    # Cancel and wait for sensor task
-    if app_state._sensor_task is not None:
-        app_state._sensor_task.cancel()
-        try:
-            await asyncio.wait_for(app_state._sensor_task, timeout=2.0)
-        except (asyncio.CancelledError, asyncio.TimeoutError):
-            pass
+    # Stop sensor polling
+    if app_state.controller is not None:
+        await app_state.controller.stop_sensor_polling()
 
     # Stop thermal model
     if app_state.controller is not None and app_state.controller._thermal_model is not None:
@@ -252,6 +211,13 @@ async def _shutdown_tasks() -> None:
         except Exception as e:
             logger.error("GPIO cleanup error: %s", e)
 
+    # Release sensor resources (the Raspberry Pi read thread pool)
+    if app_state.controller is not None and app_state.controller.sensors is not None:
+        try:
+            await app_state.controller.sensors.cleanup()
+        except Exception as e:
+            logger.error("Sensor cleanup error: %s", e)
+
     logger.info("Icemaker API shutdown complete (graceful=%s)", graceful_restart)
 
 
@@ -311,11 +277,8 @@ def create_app() -> Quart:
             name="fsm-controller",
         )
 
-        # Start sensor polling in background task
-        app_state._sensor_task = asyncio.create_task(
-            _poll_sensors_loop(),
-            name="sensor-polling",
-        )
+        # Start the controller's sensor polling (adaptive rate, TEMP_READING events)
+        app_state.controller.start_sensor_polling()
 
         logger.info("Icemaker API started")
 
@@ -66,6 +66,7 @@ async def set_relay():
         abort(400, description=f"Invalid relay: {command.relay}. Valid relays: {valid_relays}")
 
     await state.controller.gpio.set_relay(relay, command.on)
+    state.controller.invalidate_relay_cache()
 
     # Broadcast relay update
     relay_states = await state.controller.gpio.get_all_relays()
@@ -90,8 +91,8 @@ async def all_relays_off():
     if state.controller is None or state.controller.gpio is None:
         abort(503, description="Controller not initialized")
 
-    for relay in RelayName:
-        await state.controller.gpio.set_relay(relay, False)
+    await state.controller.gpio.set_relays(dict.fromkeys(RelayName, False))
+    state.controller.invalidate_relay_cache()
 
     # Broadcast relay update
     await state.ws_manager.broadcast_relay_update({
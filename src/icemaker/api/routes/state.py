@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING
 
 from quart import Blueprint, abort, request, websocket
 
+from ...core.events import monotonic_to_datetime
 from ..schemas import CycleCommand, StateResponse, StateTransitionRequest
 
 if TYPE_CHECKING:
@@ -44,14 +45,14 @@ async def get_current_state():
     response = StateResponse(
         state=fsm.state.name,
         previous_state=fsm.previous_state.name if fsm.previous_state else None,
-        state_enter_time=ctx.state_enter_time,
+        state_enter_time=monotonic_to_datetime(ctx.state_enter_time),
         cycle_count=ctx.cycle_count,
         session_cycle_count=ctx.session_cycle_count,
         plate_temp=ctx.plate_temp,
         bin_temp=ctx.bin_temp,
         target_temp=ctx.target_temp,
         time_in_state_seconds=fsm.time_in_state(),
-        chill_mode=ctx.chill_mode,
+        chill_mode=ctx.chill_mode.label if ctx.chill_mode is not None else None,
         shutdown_requested=state.controller.shutdown_requested,
         bin_full=bin_full,
     )
@@ -5,14 +5,11 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from dataclasses import asdict
 from datetime import datetime
 from typing import Any
 
 from quart import Websocket
 
-from .schemas import WebSocketMessage
-
 logger = logging.getLogger(__name__)
 
 
@@ -71,16 +68,13 @@ class WebSocketManager:
         if not self._connections:
             return
 
-        message = WebSocketMessage(
-            type=message_type,
-            data=data,
-            timestamp=datetime.now(),
-        )
-
-        # Convert dataclass to JSON, handling datetime serialization
-        message_dict = asdict(message)
-        message_dict["timestamp"] = message_dict["timestamp"].isoformat()
-        json_message = json.dumps(message_dict)
+        # Same layout as schemas.WebSocketMessage, built directly: asdict()
+        # would deep-copy data on every temperature broadcast
+        json_message = json.dumps({
+            "type": message_type,
+            "data": data,
+            "timestamp": datetime.now().isoformat(),
+        })
 
         async with self._lock:
             disconnected: list[Websocket] = []
@@ -10,17 +10,9 @@ from typing import Any
 
 import yaml
 
-logger = logging.getLogger(__name__)
-
+from .hal.factory import is_raspberry_pi
 
-def _is_raspberry_pi() -> bool:
-    """Detect if running on a Raspberry Pi."""
-    try:
-        with open("/proc/cpuinfo") as f:
-            cpuinfo = f.read()
-            return "Raspberry Pi" in cpuinfo or "BCM" in cpuinfo
-    except (FileNotFoundError, PermissionError):
-        return False
+logger = logging.getLogger(__name__)
 
 
 def _load_dotenv(env_path: Path) -> None:
@@ -165,7 +157,7 @@ def load_config(
     if env is None:
         env = os.environ.get("ICEMAKER_ENV")
     if env is None:
-        if _is_raspberry_pi():
+        if is_raspberry_pi():
             env = "production"
             logger.info("Raspberry Pi detected, using production environment")
         else:
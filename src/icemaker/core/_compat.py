@@ -0,0 +1,6 @@
+"""Compatibility helpers for the supported Python versions."""
+
+import sys
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters get a plain dataclass
+DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
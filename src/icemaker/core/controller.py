@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import datetime
+import os
+import time
+from bisect import bisect_right
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional, cast
 
 from ..config import IcemakerConfig, load_config
 from ..hal.base import (
@@ -19,12 +21,159 @@ from ..hal.base import (
 )
 from ..hal.factory import create_hal, create_hal_with_simulator
 from ..simulator.physics_model import PhysicsSimulator
-from .events import Event, EventType, relay_changed_event, temp_reading_event
-from .fsm import AsyncFSM, FSMContext
+from .events import (
+    Event,
+    EventType,
+    relay_changed_event,
+    relays_changed_event,
+    temp_reading_event,
+)
+from .fsm import AsyncEventListener, AsyncFSM, EventListener, FSMContext
 from .states import ChillMode, IcemakerState
 
 logger = logging.getLogger(__name__)
 
+# Shortest sensor poll delay used when the plate is close to its target
+MIN_POLL_INTERVAL: float = 0.5
+
+# Longest sensor poll delay used while the plate is still far from its target
+MAX_POLL_INTERVAL: float = 30.0
+
+# Sensor poll interval while resting (OFF, STANDBY, ERROR, SHUTDOWN)
+RESTING_POLL_INTERVAL: float = 60.0
+
+# Upper bound (seconds) on the poll back-off after repeated sensor errors
+MAX_SENSOR_ERROR_BACKOFF: float = 30.0
+
+# Seconds stop() waits for the sensor polling task to finish after cancelling
+SENSOR_TASK_STOP_TIMEOUT: float = 1.0
+
+# Minimum temperature change (°F) before another TEMP_READING event is emitted
+TEMP_EVENT_HYSTERESIS: float = 0.1
+
+# States that power_off() can leave directly for OFF
+_DIRECT_OFF_STATES = frozenset({IcemakerState.STANDBY, IcemakerState.IDLE, IcemakerState.ERROR})
+# Active ice-making states that finish the cycle before powering off
+_CYCLE_STATES = frozenset({IcemakerState.CHILL, IcemakerState.ICE, IcemakerState.HEAT})
+# States from which start_icemaking() begins a cycle immediately
+_STARTABLE_STATES = frozenset({IcemakerState.STANDBY, IcemakerState.IDLE})
+# States that act on fresh readings (cycle decisions, IDLE's bin-empty
+# restart, manual relay control in DIAGNOSTIC); polled at full rate
+_ACTIVE_POLL_STATES = frozenset({
+    IcemakerState.POWER_ON,
+    IcemakerState.CHILL,
+    IcemakerState.ICE,
+    IcemakerState.HEAT,
+    IcemakerState.IDLE,
+    IcemakerState.DIAGNOSTIC,
+})
+
+# Enum members compared on every tick or poll, bound once: enum attribute
+# access goes through a descriptor lookup each time
+_PRECHILL = ChillMode.PRECHILL
+_PLATE = SensorName.PLATE
+_ICE_BIN = SensorName.ICE_BIN
+_STATE_ENTER = EventType.STATE_ENTER
+_EMERGENCY_STOP = EventType.EMERGENCY_STOP
+
+# Relay writes for each POWER_ON priming phase, in the order they are applied
+POWER_ON_PHASE_RELAYS: tuple[tuple[tuple[RelayName, bool], ...], ...] = (
+    # Phase 1: Flush/rinse water lines
+    ((RelayName.WATER_VALVE, True), (RelayName.RECIRCULATING_PUMP, False)),
+    # Phase 2: Prime the pump
+    ((RelayName.WATER_VALVE, False), (RelayName.RECIRCULATING_PUMP, True)),
+    # Phase 3: Fill reservoir
+    ((RelayName.RECIRCULATING_PUMP, False), (RelayName.WATER_VALVE, True)),
+)
+
+# Every relay off
+ALL_RELAYS_OFF: tuple[tuple[RelayName, bool], ...] = tuple(
+    (relay, False) for relay in RelayName
+)
+
+# Cooling relay pattern; the recirculating pump is set per call (on in ICE only)
+COOLING_RELAYS: tuple[tuple[RelayName, bool], ...] = (
+    (RelayName.COMPRESSOR_1, True),
+    (RelayName.COMPRESSOR_2, True),
+    (RelayName.CONDENSER_FAN, True),
+    (RelayName.HOT_GAS_SOLENOID, False),
+    (RelayName.WATER_VALVE, False),
+    (RelayName.ICE_CUTTER, True),  # Ice cutter ON during cycle
+)
+
+# Harvest relay pattern; the water valve is set per call (on while filling)
+HEATING_RELAYS: tuple[tuple[RelayName, bool], ...] = (
+    (RelayName.COMPRESSOR_1, True),
+    (RelayName.COMPRESSOR_2, True),
+    (RelayName.CONDENSER_FAN, False),
+    (RelayName.HOT_GAS_SOLENOID, True),
+    (RelayName.RECIRCULATING_PUMP, False),
+    (RelayName.ICE_CUTTER, True),
+)
+
+# STANDBY relay pattern: everything off except the ice cutter
+STANDBY_RELAYS: tuple[tuple[RelayName, bool], ...] = (
+    (RelayName.WATER_VALVE, False),
+    (RelayName.HOT_GAS_SOLENOID, False),
+    (RelayName.RECIRCULATING_PUMP, False),
+    (RelayName.COMPRESSOR_1, False),
+    (RelayName.COMPRESSOR_2, False),
+    (RelayName.CONDENSER_FAN, False),
+    (RelayName.ICE_CUTTER, True),
+)
+
+# Bit assigned to each relay in the controller's relay-state masks
+RELAY_BITS: dict[RelayName, int] = {relay: 1 << i for i, relay in enumerate(RelayName)}
+_BIT_RELAYS: dict[int, RelayName] = {bit: relay for relay, bit in RELAY_BITS.items()}
+
+
+def relay_mask(pattern: tuple[tuple[RelayName, bool], ...]) -> tuple[int, int]:
+    """Encode a relay pattern as bitmasks.
+
+    Args:
+        pattern: (relay, on) pairs.
+
+    Returns:
+        Tuple of (mask of relays in the pattern, mask of relays turned on).
+    """
+    mask = on_bits = 0
+    for relay, on in pattern:
+        bit = RELAY_BITS[relay]
+        mask |= bit
+        if on:
+            on_bits |= bit
+    return mask, on_bits
+
+
+# Precomputed masks for the patterns applied every tick
+_ALL_OFF_MASK = relay_mask(ALL_RELAYS_OFF)
+_STANDBY_MASK = relay_mask(STANDBY_RELAYS)
+# Indexed by with_recirculation
+_COOLING_MASKS = tuple(
+    relay_mask(COOLING_RELAYS + ((RelayName.RECIRCULATING_PUMP, recirc),))
+    for recirc in (False, True)
+)
+# Indexed by with_water_valve
+_HEATING_MASKS = tuple(
+    relay_mask(HEATING_RELAYS + ((RelayName.WATER_VALVE, valve),))
+    for valve in (False, True)
+)
+# Indexed by priming phase
+_POWER_ON_PHASE_MASKS = tuple(relay_mask(relays) for relays in POWER_ON_PHASE_RELAYS)
+
+
+def sensor_error_delay(poll_interval: float, error_count: int) -> float:
+    """Get the back-off delay after consecutive sensor read errors.
+
+    Args:
+        poll_interval: Normal sensor poll interval in seconds.
+        error_count: Number of consecutive failed reads.
+
+    Returns:
+        poll_interval doubled per error, capped at MAX_SENSOR_ERROR_BACKOFF.
+    """
+    return min(poll_interval * 2.0 ** min(error_count, 16), MAX_SENSOR_ERROR_BACKOFF)
+
 
 class IcemakerController:
     """Main controller for icemaker operation.
@@ -73,8 +222,27 @@ class IcemakerController:
         )
         self._running = False
         self._sensor_task: Optional[asyncio.Task[None]] = None
-        self._event_listeners: list[callable] = []
+        # Set while the FSM is in a state that needs full-rate sensor polling
+        self._polling_active = asyncio.Event()
+        # Set on every state change to end the current poll wait early
+        self._poll_wakeup = asyncio.Event()
+        # Plate target the adaptive poll delay aims at (None: fixed interval)
+        self._poll_target: Optional[float] = None
+        # Rebuilt on add so hot paths iterate immutable snapshots; listeners
+        # are split by kind once at registration
+        self._async_listeners: tuple[AsyncEventListener, ...] = ()
+        self._sync_listeners: tuple[Callable[[Event], None], ...] = ()
         self._shutdown_requested = False  # Graceful shutdown flag
+        # Last state written to each relay through _set_relay/_set_relays,
+        # as RELAY_BITS masks: which relays are known, and which are on
+        self._relay_known = 0
+        self._relay_on = 0
+        self._cycle_count_path: Optional[Path] = None
+        self._ice_making_flag_path: Optional[Path] = None
+        self._ice_making_flag: Optional[bool] = None  # Cached flag file state
+        self._last_emitted_temps: Optional[tuple[float, float]] = None
+        self._last_plate_temp: Optional[float] = None
+        self._last_sample_time: Optional[float] = None
 
     @property
     def fsm(self) -> AsyncFSM:
@@ -96,15 +264,42 @@ class IcemakerController:
         """Whether a graceful shutdown has been requested."""
         return self._shutdown_requested
 
-    def add_event_listener(self, listener: callable) -> None:
+    def add_event_listener(self, listener: EventListener) -> None:
         """Add listener for FSM events.
 
         Args:
-            listener: Async function taking Event.
+            listener: Async or plain function taking Event. Plain functions
+                are called inline for FSM state events and scheduled with
+                loop.call_soon for relay and temperature events.
         """
-        self._event_listeners.append(listener)
+        if asyncio.iscoroutinefunction(listener):
+            async_listener = cast(AsyncEventListener, listener)
+            self._async_listeners = (*self._async_listeners, async_listener)
+        else:
+            sync_listener = cast(Callable[[Event], None], listener)
+            self._sync_listeners = (*self._sync_listeners, sync_listener)
         self._fsm.add_listener(listener)
 
+    def _notify_listeners(self, event: Event) -> Optional[asyncio.Future[list[None]]]:
+        """Deliver an event to controller-level listeners.
+
+        Sync listeners are scheduled on the loop; async listeners are run
+        concurrently.
+
+        Args:
+            event: Event to deliver.
+
+        Returns:
+            Future for the async listeners, or None if there are none.
+        """
+        if self._sync_listeners:
+            loop = asyncio.get_running_loop()
+            for listener in self._sync_listeners:
+                loop.call_soon(listener, event)
+        if not self._async_listeners:
+            return None
+        return asyncio.gather(*[listener(event) for listener in self._async_listeners])
+
     async def initialize(self) -> None:
         """Initialize hardware and register state handlers."""
         # Create HAL if not provided
@@ -119,13 +314,18 @@ class IcemakerController:
             else:
                 self._gpio, self._sensors = create_hal()
 
-        # Initialize HAL
-        await self._gpio.setup(DEFAULT_RELAY_CONFIG)
-        await self._sensors.setup(DEFAULT_SENSOR_IDS)
+        # Initialize HAL (GPIO and sensor setup are independent)
+        await asyncio.gather(
+            self._gpio.setup(DEFAULT_RELAY_CONFIG),
+            self._sensors.setup(DEFAULT_SENSOR_IDS),
+        )
 
         # Connect FSM to simulated time if using simulator
         if self._thermal_model is not None:
             self._fsm.set_simulated_time_getter(self._thermal_model.get_simulated_time)
+            self._thermal_model.set_time_advanced_callback(
+                self._fsm.notify_simulated_time_advanced
+            )
 
         # Register state handlers
         self._fsm.register_handler(IcemakerState.OFF, self._handle_off)
@@ -138,17 +338,26 @@ class IcemakerController:
         self._fsm.register_handler(IcemakerState.ERROR, self._handle_error)
         self._fsm.register_handler(IcemakerState.SHUTDOWN, self._handle_shutdown)
         self._fsm.register_handler(IcemakerState.DIAGNOSTIC, self._handle_diagnostic)
+        self._fsm.add_listener(self._on_fsm_event)
 
-        # Load persistent cycle count
-        self._load_cycle_count()
+        # Load persistent state off the event loop (SD card access can be slow)
+        await asyncio.gather(
+            asyncio.to_thread(self._load_cycle_count),
+            asyncio.to_thread(self._get_ice_making_flag),
+        )
 
         logger.info("Controller initialized")
 
     def _get_cycle_count_path(self) -> Path:
-        """Get path to the cycle count file."""
-        data_dir = Path(self.config.data_dir)
-        data_dir.mkdir(parents=True, exist_ok=True)
-        return data_dir / "cycle_count.txt"
+        """Get path to the cycle count file.
+
+        The data directory is created on first use and the path cached.
+        """
+        if self._cycle_count_path is None:
+            data_dir = Path(self.config.data_dir)
+            data_dir.mkdir(parents=True, exist_ok=True)
+            self._cycle_count_path = data_dir / "cycle_count.txt"
+        return self._cycle_count_path
 
     def _load_cycle_count(self) -> None:
         """Load lifetime cycle count from persistent storage."""
@@ -164,26 +373,41 @@ class IcemakerController:
             logger.warning("Failed to load cycle count: %s", e)
 
     def _save_cycle_count(self) -> None:
-        """Save lifetime cycle count to persistent storage."""
+        """Save lifetime cycle count to persistent storage.
+
+        Writes to a temporary file and atomically replaces the real one so
+        a power loss mid-write never leaves an empty or truncated count.
+        """
         path = self._get_cycle_count_path()
+        tmp_path = path.with_suffix(".tmp")
         try:
-            path.write_text(str(self._fsm.context.cycle_count))
+            tmp_path.write_text(str(self._fsm.context.cycle_count))
+            os.replace(tmp_path, path)
             logger.debug("Saved cycle count: %d", self._fsm.context.cycle_count)
         except OSError as e:
             logger.warning("Failed to save cycle count: %s", e)
 
     def _get_ice_making_flag_path(self) -> Path:
-        """Get path to the ice making flag file."""
-        data_dir = Path(self.config.data_dir)
-        data_dir.mkdir(parents=True, exist_ok=True)
-        return data_dir / "ice_making_active"
+        """Get path to the ice making flag file.
+
+        The data directory is created on first use and the path cached.
+        """
+        if self._ice_making_flag_path is None:
+            data_dir = Path(self.config.data_dir)
+            data_dir.mkdir(parents=True, exist_ok=True)
+            self._ice_making_flag_path = data_dir / "ice_making_active"
+        return self._ice_making_flag_path
 
     def _set_ice_making_flag(self, active: bool) -> None:
         """Set the ice making flag for power loss recovery.
 
+        The file is only touched when the cached flag value changes.
+
         Args:
             active: True if ice making should resume after power loss.
         """
+        if self._ice_making_flag == active:
+            return
         path = self._get_ice_making_flag_path()
         try:
             if active:
@@ -193,17 +417,22 @@ class IcemakerController:
                 if path.exists():
                     path.unlink()
                 logger.debug("Ice making flag cleared")
+            self._ice_making_flag = active
         except OSError as e:
             logger.warning("Failed to set ice making flag: %s", e)
 
     def _get_ice_making_flag(self) -> bool:
         """Check if ice making should resume after power loss.
 
+        The flag file is checked once and the result cached; later updates
+        go through _set_ice_making_flag().
+
         Returns:
             True if ice making was active before power loss.
         """
-        path = self._get_ice_making_flag_path()
-        return path.exists()
+        if self._ice_making_flag is None:
+            self._ice_making_flag = self._get_ice_making_flag_path().exists()
+        return self._ice_making_flag
 
     async def start(self) -> None:
         """Start the controller.
@@ -223,7 +452,7 @@ class IcemakerController:
             await self._thermal_model.start()
 
         # Start sensor polling
-        self._sensor_task = asyncio.create_task(self._poll_sensors())
+        self.start_sensor_polling()
 
         # Auto-resume ice making if flag was set (power loss recovery)
         if self._get_ice_making_flag():
@@ -264,31 +493,68 @@ class IcemakerController:
         else:
             await self._fsm.stop()
 
-        # Stop sensor polling
-        if self._sensor_task is not None:
-            self._sensor_task.cancel()
-            try:
-                await self._sensor_task
-            except asyncio.CancelledError:
-                pass
-
         # Stop thermal model
         if self._thermal_model is not None:
             await self._thermal_model.stop()
 
-        # Handle relays based on shutdown mode
-        if self._gpio is not None:
-            if graceful:
-                # Don't turn off relays - just cleanup GPIO without state changes
-                await self._gpio.cleanup()
-            else:
-                # Full shutdown - turn off all relays and clear recovery flag
-                await self._all_relays_off()
-                await self._gpio.cleanup()
-                self._set_ice_making_flag(False)
+        # Sensor polling does not touch the relays, so it is torn down
+        # while the relays are handled
+        await asyncio.gather(
+            self.stop_sensor_polling(),
+            self._shutdown_relays(graceful),
+        )
+        if self._sensors is not None:
+            await self._sensors.cleanup()
 
         logger.info("Controller stopped (graceful=%s)", graceful)
 
+    def start_sensor_polling(self) -> None:
+        """Start the background sensor polling task.
+
+        Called by start(). Applications that run the FSM themselves (the API
+        server) call it after initialize() so readings, TEMP_READING events
+        and the poll rate all come from the same loop.
+        """
+        if self._sensor_task is not None and not self._sensor_task.done():
+            return
+        self._running = True
+        if self._fsm.state in _ACTIVE_POLL_STATES:
+            self._polling_active.set()
+        self._sensor_task = asyncio.create_task(self._poll_sensors(), name="sensor-polling")
+
+    async def stop_sensor_polling(self) -> None:
+        """Cancel sensor polling, waiting at most SENSOR_TASK_STOP_TIMEOUT.
+
+        A sensor read stuck in a worker thread cannot be interrupted, so the
+        task is abandoned rather than blocking shutdown.
+        """
+        task = self._sensor_task
+        if task is None:
+            return
+        self._sensor_task = None
+        task.cancel()
+        await asyncio.wait((task,), timeout=SENSOR_TASK_STOP_TIMEOUT)
+        if not task.done():
+            logger.warning("Sensor polling task did not stop within %.1fs",
+                           SENSOR_TASK_STOP_TIMEOUT)
+
+    async def _shutdown_relays(self, graceful: bool) -> None:
+        """Handle relays based on shutdown mode.
+
+        Args:
+            graceful: If True, leave relays as they are for restart.
+        """
+        if self._gpio is None:
+            return
+        if graceful:
+            # Don't turn off relays - just cleanup GPIO without state changes
+            await self._gpio.cleanup()
+        else:
+            # Full shutdown - turn off all relays and clear recovery flag
+            await self._all_relays_off()
+            await self._gpio.cleanup()
+            self._set_ice_making_flag(False)
+
     async def power_off(self) -> bool:
         """Power off the icemaker.
 
@@ -302,17 +568,18 @@ class IcemakerController:
         """
         # Clear ice making flag so we don't auto-resume after power loss
         self._set_ice_making_flag(False)
+        state = self._fsm.state
 
         # Direct shutdown from non-cycle states
-        if self._fsm.state in {IcemakerState.STANDBY, IcemakerState.IDLE, IcemakerState.ERROR}:
+        if state in _DIRECT_OFF_STATES:
             self._shutdown_requested = False  # Clear flag if set
-            return await self._fsm.transition_to(IcemakerState.OFF)
+            return await self._transition_now(IcemakerState.OFF)
 
         # Graceful shutdown from cycle states
-        cycle_states = {IcemakerState.CHILL, IcemakerState.ICE, IcemakerState.HEAT}
-        if self._fsm.state in cycle_states:
+        if state in _CYCLE_STATES:
             logger.info("Graceful shutdown requested - will complete cycle then power off")
             self._shutdown_requested = True
+            self._fsm.wake()
             return True
 
         return False
@@ -329,37 +596,42 @@ class IcemakerController:
         """
         # Set flag for power loss recovery
         self._set_ice_making_flag(True)
+        state = self._fsm.state
 
         # From OFF: power on first (with optional priming)
-        if self._fsm.state == IcemakerState.OFF:
+        if state == IcemakerState.OFF:
             if self.config.priming_enabled:
                 logger.info("Starting ice making with priming sequence")
-                return await self._fsm.transition_to(IcemakerState.POWER_ON)
+                return await self._transition_now(IcemakerState.POWER_ON)
             else:
                 logger.info("Starting ice making (no priming)")
-                self._fsm.context.chill_mode = "prechill"
-                self._fsm.context.cycle_start_time = datetime.now()
-                return await self._fsm.transition_to(IcemakerState.CHILL)
+                self._fsm.context.chill_mode = ChillMode.PRECHILL
+                self._fsm.context.cycle_start_time = time.monotonic()
+                return await self._transition_now(IcemakerState.CHILL)
 
         # From STANDBY or IDLE: start cycle directly
-        if self._fsm.state in {IcemakerState.STANDBY, IcemakerState.IDLE}:
-            self._fsm.context.chill_mode = "prechill"
-            self._fsm.context.cycle_start_time = datetime.now()
-            return await self._fsm.transition_to(IcemakerState.CHILL)
+        if state in _STARTABLE_STATES:
+            self._fsm.context.chill_mode = ChillMode.PRECHILL
+            self._fsm.context.cycle_start_time = time.monotonic()
+            return await self._transition_now(IcemakerState.CHILL)
 
         return False
 
     async def emergency_stop(self) -> None:
-        """Emergency stop - turn off all relays and go to OFF."""
-        await self._all_relays_off()
+        """Emergency stop - turn off all relays and go to OFF.
+
+        Relays are switched off without per-relay events; listeners get a
+        single EMERGENCY_STOP event and can re-read relay states from it.
+        """
+        await self._all_relays_off_fast()
+        self.invalidate_relay_cache()
         # Clear ice making flag so we don't auto-resume after power loss
         self._set_ice_making_flag(False)
         # Force transition to OFF
-        self._fsm._state = IcemakerState.OFF
-        await self._fsm._emit_event(Event(
-            type=EventType.EMERGENCY_STOP,
-            source="controller",
-        ))
+        await self._fsm.force_state(
+            IcemakerState.OFF,
+            Event(type=EventType.EMERGENCY_STOP, source="controller"),
+        )
 
     async def enter_diagnostic(self) -> bool:
         """Enter diagnostic mode from OFF state.
@@ -373,7 +645,7 @@ class IcemakerController:
         if self._fsm.state != IcemakerState.OFF:
             return False
         logger.info("Entering diagnostic mode")
-        return await self._fsm.transition_to(IcemakerState.DIAGNOSTIC)
+        return await self._transition_now(IcemakerState.DIAGNOSTIC)
 
     async def exit_diagnostic(self) -> bool:
         """Exit diagnostic mode and return to OFF state.
@@ -387,70 +659,271 @@ class IcemakerController:
             return False
         logger.info("Exiting diagnostic mode")
         await self._all_relays_off()
-        return await self._fsm.transition_to(IcemakerState.OFF)
+        return await self._transition_now(IcemakerState.OFF)
+
+    async def _transition_now(self, state: IcemakerState) -> bool:
+        """Transition on behalf of an external command and wake the FSM.
+
+        Waking the FSM loop runs the new state's handler right away instead
+        of after the remainder of the current poll interval.
+
+        Args:
+            state: Target state.
+
+        Returns:
+            True if the transition succeeded.
+        """
+        success = await self._fsm.transition_to(state)
+        if success:
+            self._fsm.wake()
+        return success
 
     # -------------------------------------------------------------------------
     # Relay control helpers
     # -------------------------------------------------------------------------
 
+    def invalidate_relay_cache(self) -> None:
+        """Forget the last-written relay states.
+
+        Must be called after relays are written directly through the GPIO
+        interface (e.g. manual control from the API) so the next
+        _set_relay() call re-issues the write.
+        """
+        self._relay_known = 0
+
     async def _set_relay(self, relay: RelayName, on: bool) -> None:
-        """Set relay state and emit event."""
+        """Set relay state and emit event.
+
+        Writes that match the last state set through this method are
+        skipped, so handlers can re-assert their relay pattern every tick.
+        """
+        bit = RELAY_BITS[relay]
+        if self._relay_known & bit and bool(self._relay_on & bit) == on:
+            return
         await self._gpio.set_relay(relay, on)
-        for listener in self._event_listeners:
-            await listener(relay_changed_event(relay.value, on))
+        self._relay_known |= bit
+        if on:
+            self._relay_on |= bit
+        else:
+            self._relay_on &= ~bit
+        if not (self._async_listeners or self._sync_listeners):
+            return
+        notify = self._notify_listeners(relay_changed_event(relay.value, on))
+        if notify is not None:
+            await notify
 
     async def _all_relays_off(self) -> None:
-        """Turn off all relays and emit events."""
-        for relay in RelayName:
-            await self._set_relay(relay, False)
+        """Turn off all relays and emit a relay event.
+
+        Resting-state handlers call this every tick; once the relay cache
+        shows every relay off, the call returns without writing.
+        """
+        await self._set_relays(*_ALL_OFF_MASK)
+
+    async def _all_relays_off_fast(self) -> None:
+        """Turn off all relays in one GPIO operation without emitting relay events."""
+        await self._gpio.set_relays(dict(ALL_RELAYS_OFF))
+
+    async def _set_relays(self, mask: int, on_bits: int) -> None:
+        """Apply a relay pattern, writing only relays that differ from the cache.
+
+        The changed relays are written in one GPIO operation and reported
+        in a single RELAY_CHANGED event. When nothing changed this is a
+        single integer test.
+
+        Args:
+            mask: RELAY_BITS mask of the relays the pattern sets.
+            on_bits: RELAY_BITS mask of the relays to turn on.
+        """
+        changed = mask & ((on_bits ^ self._relay_on) | ~self._relay_known)
+        if not changed:
+            return
+        pending: dict[RelayName, bool] = {}
+        remaining = changed
+        while remaining:
+            bit = remaining & -remaining
+            pending[_BIT_RELAYS[bit]] = bool(on_bits & bit)
+            remaining ^= bit
+        await self._gpio.set_relays(pending)
+        self._relay_known |= changed
+        self._relay_on = (self._relay_on & ~changed) | (on_bits & changed)
+        if not (self._async_listeners or self._sync_listeners):
+            return
+        notify = self._notify_listeners(
+            relays_changed_event({relay.value: on for relay, on in pending.items()})
+        )
+        if notify is not None:
+            await notify
 
     async def _set_cooling_relays(self, with_recirculation: bool = False) -> None:
         """Set relays for cooling mode."""
-        await self._set_relay(RelayName.COMPRESSOR_1, True)
-        await self._set_relay(RelayName.COMPRESSOR_2, True)
-        await self._set_relay(RelayName.CONDENSER_FAN, True)
-        await self._set_relay(RelayName.HOT_GAS_SOLENOID, False)
-        await self._set_relay(RelayName.WATER_VALVE, False)
-        await self._set_relay(RelayName.RECIRCULATING_PUMP, with_recirculation)
-        await self._set_relay(RelayName.ICE_CUTTER, True)  # Ice cutter ON during cycle
+        await self._set_relays(*_COOLING_MASKS[with_recirculation])
 
-    async def _set_heating_relays(self) -> None:
+    async def _set_heating_relays(self, with_water_valve: bool = True) -> None:
         """Set relays for heating/harvest mode."""
-        await self._set_relay(RelayName.COMPRESSOR_1, True)
-        await self._set_relay(RelayName.COMPRESSOR_2, True)
-        await self._set_relay(RelayName.CONDENSER_FAN, False)
-        await self._set_relay(RelayName.HOT_GAS_SOLENOID, True)
-        await self._set_relay(RelayName.WATER_VALVE, True)
-        await self._set_relay(RelayName.RECIRCULATING_PUMP, False)
-        await self._set_relay(RelayName.ICE_CUTTER, True)
+        await self._set_relays(*_HEATING_MASKS[with_water_valve])
 
     # -------------------------------------------------------------------------
     # Sensor polling
     # -------------------------------------------------------------------------
 
+    def target_temp_for_state(self, state: IcemakerState) -> Optional[float]:
+        """Get the configured plate target temperature for a state.
+
+        Args:
+            state: State to look up.
+
+        Returns:
+            Target temperature in Fahrenheit, or None if the state has none.
+        """
+        config = self.config
+        if state is IcemakerState.CHILL:
+            if self._fsm.context.chill_mode is ChillMode.RECHILL:
+                return config.rechill.target_temp
+            return config.prechill.target_temp
+        if state is IcemakerState.ICE:
+            return config.ice_making.target_temp
+        if state is IcemakerState.HEAT:
+            return config.harvest.target_temp
+        return None
+
+    def _on_fsm_event(self, event: Event) -> None:
+        """Retune sensor polling when the FSM enters a new state.
+
+        Switches between full-rate and resting polling, points the adaptive
+        delay at the new state's target, and ends the current poll wait so
+        the new state starts from a fresh reading.
+
+        Args:
+            event: FSM event.
+        """
+        if event.type is _STATE_ENTER or event.type is _EMERGENCY_STOP:
+            state = self._fsm.state
+            if state in _ACTIVE_POLL_STATES:
+                self._polling_active.set()
+            else:
+                self._polling_active.clear()
+            self._poll_target = self.target_temp_for_state(state)
+            # The previous state's temperature trend says nothing about this one
+            self._last_plate_temp = None
+            self._last_sample_time = None
+            self._poll_wakeup.set()
+
     async def _poll_sensors(self) -> None:
-        """Background task to poll temperature sensors."""
-        while self._running:
-            try:
-                temps = await self._sensors.read_all_temperatures()
-                self._fsm.context.plate_temp = temps.get(SensorName.PLATE, 70.0)
-                self._fsm.context.bin_temp = temps.get(SensorName.ICE_BIN, 70.0)
+        """Background task to poll temperature sensors.
 
-                # Emit temperature reading event
-                for listener in self._event_listeners:
-                    await listener(temp_reading_event(
-                        self._fsm.context.plate_temp,
-                        self._fsm.context.bin_temp,
-                    ))
+        Listener notification for one reading overlaps with the sensor read
+        for the next: the notify is started in the background and only
+        awaited once the following read has been kicked off.
 
-            except Exception as e:
-                logger.error("Sensor polling error: %s", e)
+        In active states the delay adapts to the plate temperature trend.
+        In resting states the sensors are read every RESTING_POLL_INTERVAL
+        seconds. Any state change ends the wait so the new state starts
+        from a fresh reading.
+
+        Repeated read errors are logged once with a traceback and back off
+        exponentially until a read succeeds.
+        """
+        errors = 0
+        notify: Optional[asyncio.Future[list[None]]] = None
+        read_task: Optional[asyncio.Future[dict[SensorName, float]]] = None
+        ctx = self._fsm.context
+        try:
+            while self._running:
+                # State changes from here on trigger another read right away
+                self._poll_wakeup.clear()
+                read_task = asyncio.ensure_future(self._sensors.read_all_temperatures())
+
+                if notify is not None:
+                    try:
+                        await notify
+                    except Exception as e:
+                        logger.error("Temperature listener error: %s", e)
+                    notify = None
+
+                try:
+                    temps = await read_task
+                    if errors:
+                        logger.info("Sensor polling recovered after %d errors", errors)
+                        errors = 0
+                    plate_temp = temps.get(_PLATE, 70.0)
+                    bin_temp = temps.get(_ICE_BIN, 70.0)
+                    ctx.plate_temp = plate_temp
+                    ctx.bin_temp = bin_temp
+
+                    # Emit temperature reading event, skipping stable readings
+                    last = self._last_emitted_temps
+                    if (self._async_listeners or self._sync_listeners) and (
+                        last is None
+                        or abs(plate_temp - last[0]) >= TEMP_EVENT_HYSTERESIS
+                        or abs(bin_temp - last[1]) >= TEMP_EVENT_HYSTERESIS
+                    ):
+                        self._last_emitted_temps = (plate_temp, bin_temp)
+                        notify = self._notify_listeners(
+                            temp_reading_event(plate_temp, bin_temp)
+                        )
+
+                except Exception as e:
+                    errors += 1
+                    if errors == 1:
+                        logger.exception("Sensor polling error")
+                    else:
+                        logger.debug("Sensor polling error (%d consecutive): %s", errors, e)
+
+                if errors:
+                    await asyncio.sleep(sensor_error_delay(self.config.poll_interval, errors))
+                    continue
+                if self._polling_active.is_set():
+                    delay = self._next_poll_delay()
+                else:
+                    delay = max(RESTING_POLL_INTERVAL, self.config.poll_interval)
+                try:
+                    await asyncio.wait_for(self._poll_wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            for pending in (read_task, notify):
+                if pending is not None and not pending.done():
+                    pending.cancel()
+
+    def _next_poll_delay(self) -> float:
+        """Predict how long to wait before the next sensor read.
+
+        Uses the plate temperature rate of change since the previous sample
+        to estimate the time remaining until the current state's target is
+        reached, and sleeps a tenth of that. Far from the target the delay
+        grows up to MAX_POLL_INTERVAL (or poll_interval, if longer); near
+        the target it shrinks to MIN_POLL_INTERVAL so the crossing is caught
+        promptly. States without a target, a flat trend, or a plate moving
+        away from its target use poll_interval.
 
-            await asyncio.sleep(self.config.poll_interval)
+        Returns:
+            Seconds to sleep before the next sensor read.
+        """
+        poll_interval = self.config.poll_interval
+        min_interval = min(MIN_POLL_INTERVAL, poll_interval)
+        now = time.monotonic()
+        temp = self._fsm.context.plate_temp
 
-    def _is_bin_full(self) -> bool:
-        """Check if ice bin is full based on temperature threshold."""
-        return self._fsm.context.bin_temp < self.config.bin_full_threshold
+        last_temp = self._last_plate_temp
+        last_time = self._last_sample_time
+        self._last_plate_temp = temp
+        self._last_sample_time = now
+
+        target = self._poll_target
+        if target is None or last_temp is None or last_time is None or now <= last_time:
+            return poll_interval
+
+        rate = (temp - last_temp) / (now - last_time)
+        if rate == 0:
+            return poll_interval
+
+        eta = (target - temp) / rate
+        if eta <= 0:
+            # Moving away from the target
+            return poll_interval
+
+        return max(min_interval, min(eta / 10, max(MAX_POLL_INTERVAL, poll_interval)))
 
     # -------------------------------------------------------------------------
     # State handlers
@@ -486,15 +959,8 @@ class IcemakerController:
         Ice cutter stays ON during standby to ensure any remaining ice is cut.
         Auto-transitions to OFF after standby_timeout if shutdown was requested.
         """
-        # Turn off all relays except ice cutter
-        await self._set_relay(RelayName.WATER_VALVE, False)
-        await self._set_relay(RelayName.HOT_GAS_SOLENOID, False)
-        await self._set_relay(RelayName.RECIRCULATING_PUMP, False)
-        await self._set_relay(RelayName.COMPRESSOR_1, False)
-        await self._set_relay(RelayName.COMPRESSOR_2, False)
-        await self._set_relay(RelayName.CONDENSER_FAN, False)
-        # Keep ice cutter ON
-        await self._set_relay(RelayName.ICE_CUTTER, True)
+        # Turn off all relays except ice cutter, which stays ON
+        await self._set_relays(*_STANDBY_MASK)
 
         # Check for standby timeout (auto-transition to OFF)
         elapsed = fsm.time_in_state()
@@ -526,14 +992,15 @@ class IcemakerController:
         # Check if bin has emptied enough to resume
         # bin_full returns True when temp < threshold (35°F)
         # So when temp >= threshold, bin is NOT full and we can restart
-        if not self._is_bin_full():
+        bin_full_threshold = self.config.bin_full_threshold
+        if ctx.bin_temp >= bin_full_threshold:
             logger.info(
                 "Bin no longer full (temp %.1f°F >= %.1f°F), restarting ice cycle",
                 ctx.bin_temp,
-                self.config.bin_full_threshold,
+                bin_full_threshold,
             )
-            ctx.chill_mode = "prechill"
-            ctx.cycle_start_time = datetime.now()
+            ctx.chill_mode = ChillMode.PRECHILL
+            ctx.cycle_start_time = fsm.tick_now
             return IcemakerState.CHILL
 
         # Stay in IDLE, waiting for bin to empty or manual start
@@ -552,34 +1019,25 @@ class IcemakerController:
         3. Water valve ON (fill reservoir)
         """
         elapsed = fsm.time_in_state()
-        priming = self.config.priming
-
-        phase1_end = priming.flush_time_seconds
-        phase2_end = phase1_end + priming.pump_time_seconds
-        phase3_end = phase2_end + priming.fill_time_seconds
-
-        # Phase 1: Flush/rinse water lines
-        if elapsed < phase1_end:
-            await self._set_relay(RelayName.WATER_VALVE, True)
-            await self._set_relay(RelayName.RECIRCULATING_PUMP, False)
-            return None
 
-        # Phase 2: Prime the pump
-        if elapsed < phase2_end:
-            await self._set_relay(RelayName.WATER_VALVE, False)
-            await self._set_relay(RelayName.RECIRCULATING_PUMP, True)
-            return None
-
-        # Phase 3: Fill reservoir
-        if elapsed < phase3_end:
-            await self._set_relay(RelayName.RECIRCULATING_PUMP, False)
-            await self._set_relay(RelayName.WATER_VALVE, True)
+        # Phase boundaries are computed once per POWER_ON entry
+        if ctx.state_entered or ctx.power_on_phases is None:
+            priming = self.config.priming
+            phase1_end = priming.flush_time_seconds
+            phase2_end = phase1_end + priming.pump_time_seconds
+            phase3_end = phase2_end + priming.fill_time_seconds
+            ctx.power_on_phases = (phase1_end, phase2_end, phase3_end)
+
+        # Re-asserted every tick; the relay cache skips unchanged writes
+        phase = bisect_right(ctx.power_on_phases, elapsed)
+        if phase < len(_POWER_ON_PHASE_MASKS):
+            await self._set_relays(*_POWER_ON_PHASE_MASKS[phase])
             return None
 
         # Done - transition directly to CHILL to start ice making
         await self._set_relay(RelayName.WATER_VALVE, False)
-        ctx.chill_mode = "prechill"
-        ctx.cycle_start_time = datetime.now()
+        ctx.chill_mode = ChillMode.PRECHILL
+        ctx.cycle_start_time = fsm.tick_now
         return IcemakerState.CHILL
 
     async def _handle_chill(
@@ -588,45 +1046,49 @@ class IcemakerController:
         ctx: FSMContext,
     ) -> Optional[IcemakerState]:
         """Handle CHILL state - cool plate to target temperature."""
+        config = self.config
+        bin_full_threshold = config.bin_full_threshold
+        bin_temp = ctx.bin_temp
+
         # Check bin_full once at start of prechill to prevent starting a cycle
         # when the bin is already full. Flag is reset at end of each cycle.
-        if ctx.chill_mode == "prechill" and not ctx.prechill_bin_checked:
+        if ctx.chill_mode is _PRECHILL and not ctx.prechill_bin_checked:
             ctx.prechill_bin_checked = True
-            if self._is_bin_full():
+            if bin_temp < bin_full_threshold:
                 logger.info(
                     "Bin full at cycle start (temp %.1f°F < %.1f°F), entering IDLE",
-                    ctx.bin_temp,
-                    self.config.bin_full_threshold,
+                    bin_temp,
+                    bin_full_threshold,
                 )
                 ctx.chill_mode = None
                 return IcemakerState.IDLE
 
-        # Determine chill mode and parameters
-        if ctx.chill_mode == "rechill":
-            target_temp = self.config.rechill.target_temp
-            timeout = self.config.rechill.timeout_seconds
-        else:
-            # Default to prechill
-            ctx.chill_mode = "prechill"
-            target_temp = self.config.prechill.target_temp
-            timeout = self.config.prechill.timeout_seconds
-
-        ctx.target_temp = target_temp
+        # Determine chill mode and parameters (default to prechill)
+        chill_mode = ctx.chill_mode
+        if chill_mode is None:
+            chill_mode = ctx.chill_mode = ChillMode.PRECHILL
+        # Parameters are read from config once per state entry
+        if ctx.state_entered or not ctx.state_params:
+            chill_config = (config.prechill, config.rechill)[chill_mode.value]
+            ctx.state_params = (chill_config.target_temp, chill_config.timeout_seconds)
+            ctx.target_temp = chill_config.target_temp
+        target_temp, timeout = ctx.state_params
 
         # Set relays FIRST, before checking conditions
         await self._set_cooling_relays(with_recirculation=False)
 
         # Check if we've reached target or timed out
         elapsed = fsm.time_in_state()
-        if ctx.plate_temp <= target_temp:
+        plate_temp = ctx.plate_temp
+        if plate_temp <= target_temp:
             logger.info(
                 "Chill complete: plate temp %.1f°F reached target %.1f°F",
-                ctx.plate_temp,
+                plate_temp,
                 target_temp,
             )
-            if ctx.chill_mode == "prechill":
+            if chill_mode is _PRECHILL:
                 ctx.chill_mode = None
-                ctx.cycle_start_time = datetime.now()
+                ctx.cycle_start_time = fsm.tick_now
                 return IcemakerState.ICE
             else:
                 # Rechill complete - check shutdown flag, bin, and decide next action
@@ -641,27 +1103,27 @@ class IcemakerController:
                     logger.info("Graceful shutdown: cycle complete, entering STANDBY")
                     return IcemakerState.STANDBY
 
-                if self._is_bin_full():
+                if bin_temp < bin_full_threshold:
                     logger.info("Bin full (temp %.1f°F < %.1f°F), entering IDLE to wait",
-                                ctx.bin_temp, self.config.bin_full_threshold)
+                                bin_temp, bin_full_threshold)
                     # Go to IDLE - it will poll and auto-restart when bin empties
                     return IcemakerState.IDLE
                 else:
                     # Bin not full - start next cycle immediately
                     logger.info("Bin not full (temp %.1f°F), starting next cycle",
-                                ctx.bin_temp)
-                    ctx.chill_mode = "prechill"
-                    ctx.cycle_start_time = datetime.now()
+                                bin_temp)
+                    ctx.chill_mode = ChillMode.PRECHILL
+                    ctx.cycle_start_time = fsm.tick_now
                     return IcemakerState.ICE
 
         if elapsed > timeout:
             logger.warning(
                 "Chill timeout: %.1fs elapsed, plate temp %.1f°F (target %.1f°F)",
                 elapsed,
-                ctx.plate_temp,
+                plate_temp,
                 target_temp,
             )
-            if ctx.chill_mode == "prechill":
+            if chill_mode is _PRECHILL:
                 ctx.chill_mode = None
                 return IcemakerState.ICE
             else:
@@ -676,11 +1138,11 @@ class IcemakerController:
                     logger.info("Graceful shutdown: cycle complete (timeout), entering STANDBY")
                     return IcemakerState.STANDBY
 
-                if self._is_bin_full():
+                if bin_temp < bin_full_threshold:
                     return IcemakerState.IDLE
                 # Start next cycle - transition to ICE state
-                ctx.chill_mode = "prechill"
-                ctx.cycle_start_time = datetime.now()
+                ctx.chill_mode = ChillMode.PRECHILL
+                ctx.cycle_start_time = fsm.tick_now
                 return IcemakerState.ICE
 
         return None
@@ -691,20 +1153,24 @@ class IcemakerController:
         ctx: FSMContext,
     ) -> Optional[IcemakerState]:
         """Handle ICE state - make ice with recirculation."""
-        target_temp = self.config.ice_making.target_temp
-        timeout = self.config.ice_making.timeout_seconds
-        ctx.target_temp = target_temp
+        # Parameters are read from config once per state entry
+        if ctx.state_entered or not ctx.state_params:
+            ice_config = self.config.ice_making
+            ctx.state_params = (ice_config.target_temp, ice_config.timeout_seconds)
+            ctx.target_temp = ice_config.target_temp
+        target_temp, timeout = ctx.state_params
 
         # Set relays FIRST, before checking conditions
         await self._set_cooling_relays(with_recirculation=True)
 
         elapsed = fsm.time_in_state()
+        plate_temp = ctx.plate_temp
 
         # Check if we've reached target or timed out
-        if ctx.plate_temp <= target_temp:
+        if plate_temp <= target_temp:
             logger.info(
                 "Ice making complete: plate temp %.1f°F reached target %.1f°F",
-                ctx.plate_temp,
+                plate_temp,
                 target_temp,
             )
             return IcemakerState.HEAT
@@ -713,7 +1179,7 @@ class IcemakerController:
             logger.warning(
                 "Ice making timeout: %.1fs elapsed, plate temp %.1f°F (target %.1f°F)",
                 elapsed,
-                ctx.plate_temp,
+                plate_temp,
                 target_temp,
             )
             return IcemakerState.HEAT
@@ -734,41 +1200,46 @@ class IcemakerController:
         - Ice cutter ON
         - Compressors stay ON (from ice making phase)
         """
-        target_temp = self.config.harvest.target_temp
-        timeout = self.config.harvest.timeout_seconds
-        fill_time = self.config.harvest_fill_time
-        ctx.target_temp = target_temp
+        # Parameters are read from config once per state entry
+        if ctx.state_entered or not ctx.state_params:
+            config = self.config
+            ctx.state_params = (
+                config.harvest.target_temp,
+                config.harvest.timeout_seconds,
+                config.harvest_fill_time,
+            )
+            ctx.target_temp = config.harvest.target_temp
+        target_temp, timeout, fill_time = ctx.state_params
 
         elapsed = fsm.time_in_state()
 
-        # Set heating relays, but control water valve based on fill time
-        await self._set_relay(RelayName.COMPRESSOR_1, True)
-        await self._set_relay(RelayName.COMPRESSOR_2, True)
-        await self._set_relay(RelayName.CONDENSER_FAN, False)
-        await self._set_relay(RelayName.HOT_GAS_SOLENOID, True)
-        await self._set_relay(RelayName.RECIRCULATING_PUMP, False)
-        await self._set_relay(RelayName.ICE_CUTTER, True)
-        # Water valve only runs for the first fill_time seconds
-        await self._set_relay(RelayName.WATER_VALVE, elapsed < fill_time)
+        # The water valve only runs for the first fill_time seconds
+        if not ctx.harvest_fill_done and elapsed >= fill_time:
+            ctx.harvest_fill_done = True
+
+        # Set heating relays every tick so a relay changed behind the
+        # handler's back is driven back to the harvest pattern
+        await self._set_heating_relays(with_water_valve=not ctx.harvest_fill_done)
 
         # Check if we've reached target or timed out
-        if ctx.plate_temp >= target_temp:
+        plate_temp = ctx.plate_temp
+        if plate_temp >= target_temp:
             logger.info(
                 "Harvest complete: plate temp %.1f°F reached target %.1f°F",
-                ctx.plate_temp,
+                plate_temp,
                 target_temp,
             )
-            ctx.chill_mode = "rechill"
+            ctx.chill_mode = ChillMode.RECHILL
             return IcemakerState.CHILL
 
         if elapsed > timeout:
             logger.warning(
                 "Harvest timeout: %.1fs elapsed, plate temp %.1f°F (target %.1f°F)",
                 elapsed,
-                ctx.plate_temp,
+                plate_temp,
                 target_temp,
             )
-            ctx.chill_mode = "rechill"
+            ctx.chill_mode = ChillMode.RECHILL
             return IcemakerState.CHILL
 
         return None
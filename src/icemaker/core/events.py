@@ -1,9 +1,12 @@
 """Event system for icemaker state machine."""
 
+import time
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
-from typing import Any, Optional
+from typing import Any, Mapping, Optional
+
+from ._compat import DATACLASS_SLOTS
 
 
 class EventType(Enum):
@@ -38,7 +41,26 @@ class EventType(Enum):
     RECOVERED = auto()
 
 
-@dataclass
+# EventType.name goes through an enum descriptor; to_dict uses this lookup instead
+_EVENT_TYPE_NAMES: dict[EventType, str] = {event_type: event_type.name for event_type in EventType}
+
+
+def monotonic_to_datetime(timestamp: float) -> datetime:
+    """Convert a time.monotonic() reading to local wall-clock time.
+
+    The monotonic-to-epoch offset is read on every call, so results follow
+    wall-clock steps made after startup (e.g. NTP sync on a Pi without RTC).
+
+    Args:
+        timestamp: Monotonic time in seconds.
+
+    Returns:
+        Naive local datetime for display and serialization.
+    """
+    return datetime.fromtimestamp(timestamp + time.time() - time.monotonic())
+
+
+@dataclass(**DATACLASS_SLOTS)
 class Event:
     """Event data structure for the event system.
 
@@ -47,16 +69,21 @@ class Event:
 
     Attributes:
         type: The type of event.
-        timestamp: When the event occurred.
+        timestamp: When the event occurred (time.monotonic() seconds).
         data: Optional dictionary of event-specific data.
         source: Optional identifier for the event source.
     """
 
     type: EventType
-    timestamp: datetime = field(default_factory=datetime.now)
+    timestamp: float = field(default_factory=time.monotonic)
     data: Optional[dict[str, Any]] = None
     source: Optional[str] = None
 
+    @property
+    def wall_time(self) -> datetime:
+        """Wall-clock time of the event, derived from its monotonic timestamp."""
+        return monotonic_to_datetime(self.timestamp)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert event to dictionary for serialization.
 
@@ -64,8 +91,8 @@ class Event:
             Dictionary representation of the event.
         """
         return {
-            "type": self.type.name,
-            "timestamp": self.timestamp.isoformat(),
+            "type": _EVENT_TYPE_NAMES[self.type],
+            "timestamp": self.wall_time.isoformat(),
             "data": self.data,
             "source": self.source,
         }
@@ -147,6 +174,22 @@ def relay_changed_event(
     )
 
 
+def relays_changed_event(states: Mapping[str, bool]) -> Event:
+    """Create a RELAY_CHANGED event for several relays changed together.
+
+    Args:
+        states: Mapping of relay names to their new states (True=ON).
+
+    Returns:
+        Relay changed event with a "states" mapping instead of "relay"/"state".
+    """
+    return Event(
+        type=EventType.RELAY_CHANGED,
+        data={"states": dict(states)},
+        source="gpio",
+    )
+
+
 def error_event(
     message: str,
     error_type: Optional[str] = None,
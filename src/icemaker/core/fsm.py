@@ -4,23 +4,44 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
 from typing import Awaitable, Callable, Optional
 
+from ._compat import DATACLASS_SLOTS
 from .events import Event, EventType, state_enter_event, state_exit_event
-from .states import IcemakerState, TRANSITIONS, can_transition
+from .states import ChillMode, IcemakerState, TRANSITIONS, can_transition
 
 logger = logging.getLogger(__name__)
 
 # Type alias for state handler functions
 StateHandler = Callable[["AsyncFSM", "FSMContext"], Awaitable[Optional[IcemakerState]]]
 
-# Type alias for event listeners
-EventListener = Callable[[Event], Awaitable[None]]
+# Type aliases for event listeners; plain listeners return None
+AsyncEventListener = Callable[[Event], Awaitable[None]]
+EventListener = Callable[[Event], Optional[Awaitable[None]]]
 
+# Lockstep mode re-checks simulated time at least this often (wall seconds),
+# in case the simulator advances without calling notify_simulated_time_advanced()
+LOCKSTEP_FALLBACK_INTERVAL = 0.5
 
-@dataclass
+
+def _state_timeout(state: IcemakerState) -> Optional[float]:
+    """Get the timeout for a state, or None if it never times out.
+
+    Args:
+        state: State to look up.
+
+    Returns:
+        Timeout in seconds, or None for states without a finite timeout.
+    """
+    config = TRANSITIONS.get(state)
+    if config is None or config.timeout_seconds == float("inf"):
+        return None
+    return config.timeout_seconds
+
+
+@dataclass(**DATACLASS_SLOTS)
 class FSMContext:
     """Runtime context for the FSM.
 
@@ -33,11 +54,15 @@ class FSMContext:
         target_temp: Current target temperature for the active state.
         cycle_count: Lifetime cycle count (persists across restarts).
         session_cycle_count: Session cycle count (resets on server restart).
-        state_enter_time: When the current state was entered (wall clock).
-        cycle_start_time: When the current cycle started.
+        state_enter_time: time.monotonic() value when the current state was entered.
+        cycle_start_time: time.monotonic() value when the current cycle started.
         chill_mode: Current chill mode (PRECHILL or RECHILL).
         simulated_state_enter_time: Simulated time when state was entered.
         prechill_bin_checked: Whether bin-full check was done at start of this cycle.
+        state_entered: True until the handler for a newly entered state has run once.
+        harvest_fill_done: Whether the harvest water fill has finished this HEAT state.
+        power_on_phases: End times (seconds) of the priming phases, set on POWER_ON entry.
+        state_params: Config values (target temp, timeout, ...) captured on state entry.
     """
 
     plate_temp: float = 70.0
@@ -45,11 +70,15 @@ class FSMContext:
     target_temp: float = 32.0
     cycle_count: int = 0  # Lifetime count (loaded from file)
     session_cycle_count: int = 0  # Session count (resets on restart)
-    state_enter_time: datetime = field(default_factory=datetime.now)
-    cycle_start_time: Optional[datetime] = None
-    chill_mode: Optional[str] = None  # "prechill" or "rechill"
+    state_enter_time: float = field(default_factory=time.monotonic)
+    cycle_start_time: Optional[float] = None
+    chill_mode: Optional[ChillMode] = None
     simulated_state_enter_time: Optional[float] = None  # Simulated seconds at state entry
     prechill_bin_checked: bool = False  # Whether initial bin check was done this cycle
+    state_entered: bool = True  # Cleared by the FSM after the first handler tick
+    harvest_fill_done: bool = False  # Water valve closed after harvest fill
+    power_on_phases: Optional[tuple[float, float, float]] = None  # Priming phase end times
+    state_params: tuple[float, ...] = ()  # Set by CHILL/ICE/HEAT on entry
 
 
 class AsyncFSM:
@@ -66,6 +95,26 @@ class AsyncFSM:
         await fsm.run()
     """
 
+    # Fixed attribute set; the main loop reads most of these on every poll
+    __slots__ = (
+        "_state",
+        "_previous_state",
+        "_context",
+        "_poll_interval",
+        "_running",
+        "_handlers",
+        "_state_handler",
+        "_state_timeout",
+        "_listeners",
+        "_state_waiters",
+        "_wakeup",
+        "_sim_time_advanced",
+        "_simulated_time_getter",
+        "_time_in_state",
+        "_last_poll_simulated_time",
+        "_tick_now",
+    )
+
     def __init__(
         self,
         initial_state: IcemakerState = IcemakerState.OFF,
@@ -83,24 +132,51 @@ class AsyncFSM:
         self._poll_interval = poll_interval
         self._running = False
         self._handlers: dict[IcemakerState, StateHandler] = {}
-        self._listeners: list[EventListener] = []
-        self._state_changed = asyncio.Event()
+        # Handler and timeout for the current state, refreshed on state change
+        # so the main loop does not look them up on every poll
+        self._state_handler: Optional[StateHandler] = None
+        self._state_timeout: Optional[float] = _state_timeout(initial_state)
+        # Replaced rather than mutated so emits iterate a stable snapshot
+        self._listeners: tuple[EventListener, ...] = ()
+        # One-shot futures resolved on the next state change
+        self._state_waiters: list[asyncio.Future[bool]] = []
+        self._wakeup = asyncio.Event()
+        self._sim_time_advanced = asyncio.Event()
         self._simulated_time_getter: Optional[Callable[[], float]] = None
+        # Clock-specific implementation behind time_in_state(), chosen once
+        self._time_in_state: Callable[[], float] = self._wall_time_in_state
         self._last_poll_simulated_time: float = 0.0
+        self._tick_now: float = time.monotonic()
 
     def set_simulated_time_getter(self, getter: Callable[[], float]) -> None:
         """Set a function to get current simulated time.
 
         When set, time_in_state() will use simulated time instead of wall clock.
+        The current state counts as entered at the moment the getter is set.
 
         Args:
             getter: Function that returns current simulated time in seconds.
         """
         self._simulated_time_getter = getter
+        if self._context.simulated_state_enter_time is None:
+            self._context.simulated_state_enter_time = getter()
+        self._time_in_state = self._simulated_time_in_state
+
+    def notify_simulated_time_advanced(self) -> None:
+        """Signal that simulated time has moved forward.
+
+        Called by the simulator after each update so that lockstep mode
+        re-checks simulated time instead of polling it.
+        """
+        self._sim_time_advanced.set()
 
     @property
     def state(self) -> IcemakerState:
-        """Current FSM state."""
+        """Current FSM state.
+
+        Only the FSM writes the underlying attribute, so callers that need
+        the state several times should read it once into a local.
+        """
         return self._state
 
     @property
@@ -113,6 +189,15 @@ class AsyncFSM:
         """FSM runtime context."""
         return self._context
 
+    @property
+    def tick_now(self) -> float:
+        """Monotonic time captured at the start of the current poll tick.
+
+        Handlers should use this instead of reading the clock themselves so
+        that all timestamps recorded during one tick share a single read.
+        """
+        return self._tick_now
+
     @property
     def is_running(self) -> bool:
         """Whether the FSM main loop is running."""
@@ -134,15 +219,19 @@ class AsyncFSM:
             handler: Async function taking (fsm, context) -> Optional[State].
         """
         self._handlers[state] = handler
-        logger.debug("Registered handler for state %s", state.name)
+        if state is self._state:
+            self._state_handler = handler
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Registered handler for state %s", state.name)
 
     def add_listener(self, listener: EventListener) -> None:
         """Add event listener for state changes and other events.
 
         Args:
-            listener: Async function taking Event.
+            listener: Async or plain function taking Event. Plain functions
+                are called inline when the event is emitted.
         """
-        self._listeners.append(listener)
+        self._listeners = (*self._listeners, listener)
 
     def remove_listener(self, listener: EventListener) -> None:
         """Remove an event listener.
@@ -151,19 +240,50 @@ class AsyncFSM:
             listener: Previously added listener function.
         """
         if listener in self._listeners:
-            self._listeners.remove(listener)
+            listeners = list(self._listeners)
+            listeners.remove(listener)
+            self._listeners = tuple(listeners)
 
     async def _emit_event(self, event: Event) -> None:
         """Emit event to all listeners.
 
+        Plain listeners run in order; awaitables they return are awaited
+        together, so slow listeners do not delay each other.
+
         Args:
             event: Event to emit.
         """
+        pending: list[Awaitable[None]] = []
         for listener in self._listeners:
             try:
-                await listener(event)
+                result = listener(event)
             except Exception as e:
                 logger.error("Event listener error: %s", e)
+                continue
+            if result is not None:
+                pending.append(result)
+
+        if not pending:
+            return
+        if len(pending) == 1:
+            try:
+                await pending[0]
+            except Exception as e:
+                logger.error("Event listener error: %s", e)
+            return
+        for outcome in await asyncio.gather(*pending, return_exceptions=True):
+            if isinstance(outcome, BaseException):
+                logger.error("Event listener error: %s", outcome)
+
+    def wake(self) -> None:
+        """Wake the main loop so the current handler runs without waiting.
+
+        Called by the controller after external commands (start, stop,
+        diagnostics) so they take effect immediately instead of on the
+        next poll interval.
+        """
+        self._wakeup.set()
+        self._sim_time_advanced.set()
 
     async def transition_to(self, new_state: IcemakerState) -> bool:
         """Attempt to transition to a new state.
@@ -185,25 +305,66 @@ class AsyncFSM:
             )
             return False
 
-        # Exit current state
-        await self._emit_event(state_exit_event(self._state.name))
+        await self._transition_unchecked(new_state)
+        return True
+
+    async def _transition_unchecked(self, new_state: IcemakerState) -> None:
+        """Perform a transition the caller has already validated.
 
-        # Update state
+        Args:
+            new_state: Target state, known to be reachable from the current one.
+        """
+        old_name = self._state.name
+
+        # Exit current state (events are only built when someone listens)
+        if self._listeners:
+            await self._emit_event(state_exit_event(old_name))
+
+        self._set_state(new_state)
+
+        # Enter new state
+        if self._listeners:
+            await self._emit_event(state_enter_event(new_state.name, old_name))
+
+        self._notify_state_waiters()
+        logger.info("State transition: %s -> %s", old_name, new_state.name)
+
+    async def force_state(self, new_state: IcemakerState, event: Event) -> None:
+        """Switch state immediately, bypassing the transition table.
+
+        Used for emergency stops. Instead of exit/enter events, the given
+        event is emitted once the state has been updated, and the main
+        loop is woken so the new state's handler runs right away.
+
+        Args:
+            new_state: State to switch to.
+            event: Event to emit to listeners.
+        """
+        self._set_state(new_state)
+        self._notify_state_waiters()
+        await self._emit_event(event)
+        self.wake()
+
+    def _set_state(self, new_state: IcemakerState) -> None:
+        """Update the current state and reset state-entry bookkeeping.
+
+        Args:
+            new_state: State being entered.
+        """
         self._previous_state = self._state
         self._state = new_state
-        self._context.state_enter_time = datetime.now()
+        self._state_handler = self._handlers.get(new_state)
+        self._state_timeout = _state_timeout(new_state)
+        ctx = self._context
+        ctx.state_enter_time = time.monotonic()
+        ctx.state_entered = True
+        # Per-state values captured by the previous state's handler
+        ctx.state_params = ()
+        ctx.power_on_phases = None
+        ctx.harvest_fill_done = False
         # Record simulated time at state entry if available
         if self._simulated_time_getter is not None:
-            self._context.simulated_state_enter_time = self._simulated_time_getter()
-
-        # Enter new state
-        await self._emit_event(
-            state_enter_event(new_state.name, self._previous_state.name)
-        )
-
-        self._state_changed.set()
-        logger.info("State transition: %s -> %s", self._previous_state.name, new_state.name)
-        return True
+            ctx.simulated_state_enter_time = self._simulated_time_getter()
 
     def time_in_state(self) -> float:
         """Get seconds elapsed in current state.
@@ -213,12 +374,19 @@ class AsyncFSM:
         Returns:
             Seconds since entering current state.
         """
-        if (
-            self._simulated_time_getter is not None
-            and self._context.simulated_state_enter_time is not None
-        ):
-            return self._simulated_time_getter() - self._context.simulated_state_enter_time
-        return (datetime.now() - self._context.state_enter_time).total_seconds()
+        return self._time_in_state()
+
+    def _wall_time_in_state(self) -> float:
+        """time_in_state() on the monotonic wall clock."""
+        return time.monotonic() - self._context.state_enter_time
+
+    def _simulated_time_in_state(self) -> float:
+        """time_in_state() on simulated time."""
+        getter = self._simulated_time_getter
+        enter_time = self._context.simulated_state_enter_time
+        # Both are set by set_simulated_time_getter() before this is selected
+        assert getter is not None and enter_time is not None
+        return getter() - enter_time
 
     async def wait_for_state_change(self, timeout: Optional[float] = None) -> bool:
         """Wait for a state change to occur.
@@ -229,15 +397,28 @@ class AsyncFSM:
         Returns:
             True if state changed, False if timeout occurred.
         """
-        self._state_changed.clear()
+        waiter: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self._state_waiters.append(waiter)
         try:
-            await asyncio.wait_for(
-                self._state_changed.wait(),
-                timeout=timeout,
-            )
-            return True
+            if timeout is None:
+                return await waiter
+            return await asyncio.wait_for(waiter, timeout=timeout)
         except asyncio.TimeoutError:
             return False
+        finally:
+            # Resolved waiters were already dropped by _notify_state_waiters()
+            if waiter in self._state_waiters:
+                self._state_waiters.remove(waiter)
+
+    def _notify_state_waiters(self) -> None:
+        """Resolve all pending wait_for_state_change() calls."""
+        if not self._state_waiters:
+            return
+        waiters = self._state_waiters
+        self._state_waiters = []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(True)
 
     async def run(self) -> None:
         """Main FSM loop.
@@ -257,30 +438,37 @@ class AsyncFSM:
             self._last_poll_simulated_time = self._simulated_time_getter()
 
         # Emit initial state enter event
-        await self._emit_event(state_enter_event(self._state.name))
+        if self._listeners:
+            await self._emit_event(state_enter_event(self._state.name))
 
         while self._running:
-            handler = self._handlers.get(self._state)
+            self._tick_now = time.monotonic()
+            handler = self._state_handler
 
             if handler:
                 try:
-                    # Check for timeout
-                    config = TRANSITIONS.get(self._state)
-                    if config:
+                    # Check for timeout (only reported through an event)
+                    timeout = self._state_timeout
+                    if timeout is not None and self._listeners:
                         elapsed = self.time_in_state()
-                        if elapsed > config.timeout_seconds:
+                        if elapsed > timeout:
                             await self._emit_event(Event(
                                 type=EventType.STATE_TIMEOUT,
                                 data={
                                     "state": self._state.name,
                                     "elapsed": elapsed,
-                                    "timeout": config.timeout_seconds,
+                                    "timeout": timeout,
                                 },
                                 source="fsm",
                             ))
 
                     # Execute state handler
+                    state = self._state
                     next_state = await handler(self, self._context)
+                    # A transition made while the handler was suspended (start,
+                    # force_state, ...) leaves the new state's entry flag set
+                    if self._state is state:
+                        self._context.state_entered = False
 
                     # Transition if handler returns new state
                     if next_state is not None and next_state != self._state:
@@ -294,17 +482,18 @@ class AsyncFSM:
                     break
                 except Exception as e:
                     logger.error("Handler error in %s: %s", self._state.name, e)
-                    await self._emit_event(Event(
-                        type=EventType.ERROR,
-                        data={
-                            "state": self._state.name,
-                            "error": str(e),
-                        },
-                        source="fsm",
-                    ))
+                    if self._listeners:
+                        await self._emit_event(Event(
+                            type=EventType.ERROR,
+                            data={
+                                "state": self._state.name,
+                                "error": str(e),
+                            },
+                            source="fsm",
+                        ))
                     # Transition to ERROR state
                     if can_transition(self._state, IcemakerState.ERROR):
-                        await self.transition_to(IcemakerState.ERROR)
+                        await self._transition_unchecked(IcemakerState.ERROR)
             else:
                 # No handler for this state, just wait
                 try:
@@ -320,20 +509,32 @@ class AsyncFSM:
 
         In lockstep mode (with simulated time), waits for simulated time
         to advance by poll_interval. Otherwise uses wall-clock sleep.
+        Either wait ends early when wake() is called.
         """
         if self._simulated_time_getter is not None:
             # Lockstep mode: wait for simulated time to advance
             target_time = self._last_poll_simulated_time + self._poll_interval
             while self._running:
                 current_sim_time = self._simulated_time_getter()
-                if current_sim_time >= target_time:
+                if current_sim_time >= target_time or self._wakeup.is_set():
                     self._last_poll_simulated_time = current_sim_time
                     break
-                # Brief sleep to allow simulation to advance
-                await asyncio.sleep(0.01)
+                # Sleep until the simulator (or wake()) signals an advance
+                self._sim_time_advanced.clear()
+                try:
+                    await asyncio.wait_for(
+                        self._sim_time_advanced.wait(),
+                        timeout=LOCKSTEP_FALLBACK_INTERVAL,
+                    )
+                except asyncio.TimeoutError:
+                    pass
         else:
             # Wall-clock mode
-            await asyncio.sleep(self._poll_interval)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._poll_interval)
+            except asyncio.TimeoutError:
+                pass
+        self._wakeup.clear()
 
     async def stop(self) -> None:
         """Stop the FSM.
@@ -342,4 +543,4 @@ class AsyncFSM:
         """
         self._running = False
         if can_transition(self._state, IcemakerState.SHUTDOWN):
-            await self.transition_to(IcemakerState.SHUTDOWN)
+            await self._transition_unchecked(IcemakerState.SHUTDOWN)
@@ -6,6 +6,8 @@ from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Optional
 
+from ._compat import DATACLASS_SLOTS
+
 
 class IcemakerState(Enum):
     """Icemaker operational states.
@@ -41,13 +43,20 @@ class ChillMode(Enum):
 
     PRECHILL: Initial cooling before ice making (target: 32°F)
     RECHILL: Cooling after harvest before next cycle (target: 35°F)
+
+    Values are 0-based so a mode's .value can index per-mode tuples.
     """
 
-    PRECHILL = auto()
-    RECHILL = auto()
+    PRECHILL = 0
+    RECHILL = 1
+
+    @property
+    def label(self) -> str:
+        """Lowercase name used by the API ("prechill" or "rechill")."""
+        return self.name.lower()
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class StateConfig:
     """Configuration for a specific state.
 
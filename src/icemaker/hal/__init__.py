@@ -1,5 +1,10 @@
 """Hardware abstraction layer for GPIO and sensors."""
 
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
 from .base import (
     GPIOInterface,
     TemperatureSensorInterface,
@@ -9,6 +14,15 @@ from .base import (
 )
 from .factory import create_hal, is_raspberry_pi
 
+# Implementations imported on first access (PEP 562), so importing the
+# package does not load modules for hardware that is not in use
+_LAZY_IMPORTS: dict[str, str] = {
+    "MockGPIO": ".mock_gpio",
+    "MockSensors": ".mock_sensors",
+    "RaspberryPiGPIO": ".rpi_gpio",
+    "RaspberryPiSensors": ".rpi_sensors",
+}
+
 __all__ = [
     "GPIOInterface",
     "TemperatureSensorInterface",
@@ -17,4 +31,15 @@ __all__ = [
     "RelayConfig",
     "create_hal",
     "is_raspberry_pi",
+    *_LAZY_IMPORTS,
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import HAL implementations lazily on first attribute access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
@@ -5,7 +5,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Callable
+from typing import Callable, Mapping
 
 
 class RelayName(Enum):
@@ -40,6 +40,9 @@ class RelayConfig:
 # Type alias for relay change callback
 RelayChangeCallback = Callable[[RelayName, bool], None]
 
+# Type alias for batched relay change callback (receives only changed relays)
+RelayBatchChangeCallback = Callable[[Mapping[RelayName, bool]], None]
+
 
 class GPIOInterface(ABC):
     """Abstract interface for GPIO control.
@@ -65,6 +68,18 @@ class GPIOInterface(ABC):
             on: True to turn relay ON, False to turn OFF.
         """
 
+    async def set_relays(self, states: Mapping[RelayName, bool]) -> None:
+        """Set several relay states in one operation.
+
+        The default implementation writes the relays one at a time.
+        Backends that can update several pins at once should override it.
+
+        Args:
+            states: Mapping of relays to their new states (True=ON).
+        """
+        for relay, on in states.items():
+            await self.set_relay(relay, on)
+
     @abstractmethod
     async def get_relay(self, relay: RelayName) -> bool:
         """Get current relay state.
@@ -77,11 +92,12 @@ class GPIOInterface(ABC):
         """
 
     @abstractmethod
-    async def get_all_relays(self) -> dict[RelayName, bool]:
+    async def get_all_relays(self) -> Mapping[RelayName, bool]:
         """Get all relay states.
 
         Returns:
-            Mapping of relay names to their current states.
+            Read-only mapping of relay names to their current states. It may
+            be a live view; copy it with dict() to keep a snapshot.
         """
 
     @abstractmethod
@@ -126,6 +142,13 @@ class TemperatureSensorInterface(ABC):
             Mapping of sensor names to temperatures in Fahrenheit.
         """
 
+    async def cleanup(self) -> None:
+        """Release sensor resources.
+
+        The default implementation does nothing. Backends that hold
+        threads or handles should override it.
+        """
+
 
 # Default relay configuration matching original code GPIO pin assignments
 DEFAULT_RELAY_CONFIG: dict[RelayName, RelayConfig] = {
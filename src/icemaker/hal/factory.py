@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from .base import (
@@ -20,20 +21,33 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Board model string exposed by the device tree (a few dozen bytes)
+DEVICE_TREE_MODEL_PATH = "/proc/device-tree/model"
 
+
+@lru_cache(maxsize=1)
 def is_raspberry_pi() -> bool:
     """Detect if running on Raspberry Pi.
 
-    Checks /proc/cpuinfo for Raspberry Pi or BCM identifiers.
+    Reads the device-tree model string, falling back to scanning
+    /proc/cpuinfo for Raspberry Pi or BCM identifiers on kernels that do
+    not expose it. The hardware cannot change while the process runs, so
+    the result is cached.
 
     Returns:
         True if running on Raspberry Pi, False otherwise.
     """
+    try:
+        with open(DEVICE_TREE_MODEL_PATH, "rb") as f:
+            return b"Raspberry Pi" in f.read(128)
+    except OSError:
+        pass
+
     try:
         with open("/proc/cpuinfo") as f:
             cpuinfo = f.read()
             return "Raspberry Pi" in cpuinfo or "BCM" in cpuinfo
-    except FileNotFoundError:
+    except OSError:
         return False
 
 
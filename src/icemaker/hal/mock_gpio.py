@@ -3,9 +3,16 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
-from .base import GPIOInterface, RelayChangeCallback, RelayConfig, RelayName
+from .base import (
+    GPIOInterface,
+    RelayBatchChangeCallback,
+    RelayChangeCallback,
+    RelayConfig,
+    RelayName,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +26,10 @@ class MockGPIO(GPIOInterface):
 
     def __init__(self) -> None:
         self._states: dict[RelayName, bool] = {}
+        self._states_view: Mapping[RelayName, bool] = MappingProxyType(self._states)
         self._configs: dict[RelayName, RelayConfig] = {}
         self._on_change: Optional[RelayChangeCallback] = None
+        self._on_batch_change: Optional[RelayBatchChangeCallback] = None
 
     def set_change_callback(self, callback: RelayChangeCallback) -> None:
         """Set callback for relay state changes.
@@ -33,6 +42,18 @@ class MockGPIO(GPIOInterface):
         """
         self._on_change = callback
 
+    def set_batch_change_callback(self, callback: RelayBatchChangeCallback) -> None:
+        """Set callback for batched relay state changes.
+
+        When set, set_relays() reports all of its changes in a single call
+        instead of invoking the per-relay change callback once per relay.
+
+        Args:
+            callback: Function called with a mapping of changed relays to
+                their new states.
+        """
+        self._on_batch_change = callback
+
     async def setup(self, relay_configs: dict[RelayName, RelayConfig]) -> None:
         """Initialize mock GPIO pins.
 
@@ -63,7 +84,39 @@ class MockGPIO(GPIOInterface):
         if self._on_change and old_state != on:
             self._on_change(relay, on)
 
-        logger.debug("[MOCK] Relay %s: %s", relay.value, "ON" if on else "OFF")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[MOCK] Relay %s: %s", relay.value, "ON" if on else "OFF")
+
+    async def set_relays(self, states: Mapping[RelayName, bool]) -> None:
+        """Set several relay states in one operation.
+
+        Args:
+            states: Mapping of relays to their new states (True=ON).
+
+        Raises:
+            ValueError: If any relay was not configured during setup.
+        """
+        configs = self._configs
+        for relay in states:
+            if relay not in configs:
+                raise ValueError(f"Unknown relay: {relay}")
+
+        current = self._states
+        changed = {
+            relay: on for relay, on in states.items() if current.get(relay, False) != on
+        }
+        current.update(states)
+
+        if changed:
+            if self._on_batch_change:
+                self._on_batch_change(changed)
+            elif self._on_change:
+                for relay, on in changed.items():
+                    self._on_change(relay, on)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for relay, on in states.items():
+                logger.debug("[MOCK] Relay %s: %s", relay.value, "ON" if on else "OFF")
 
     async def get_relay(self, relay: RelayName) -> bool:
         """Get current relay state.
@@ -76,13 +129,13 @@ class MockGPIO(GPIOInterface):
         """
         return self._states.get(relay, False)
 
-    async def get_all_relays(self) -> dict[RelayName, bool]:
+    async def get_all_relays(self) -> Mapping[RelayName, bool]:
         """Get all relay states.
 
         Returns:
-            Mapping of relay names to their current states.
+            Read-only live view of relay names to their current states.
         """
-        return dict(self._states)
+        return self._states_view
 
     async def cleanup(self) -> None:
         """Clean up mock GPIO resources."""
@@ -12,6 +12,9 @@ logger = logging.getLogger(__name__)
 # Type for dynamic temperature provider function
 TemperatureProvider = Callable[[SensorName], float]
 
+# Sensors read by a provider, iterated on every poll
+_SENSORS: tuple[SensorName, ...] = tuple(SensorName)
+
 
 class MockSensors(TemperatureSensorInterface):
     """Mock temperature sensors for testing.
@@ -86,6 +89,7 @@ class MockSensors(TemperatureSensorInterface):
         Returns:
             Mapping of sensor names to temperatures in Fahrenheit.
         """
-        if self._temp_provider:
-            return {s: self._temp_provider(s) for s in SensorName}
+        provider = self._temp_provider
+        if provider:
+            return {s: provider(s) for s in _SENSORS}
         return dict(self._temps)
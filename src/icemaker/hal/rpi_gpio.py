@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Mapping
 
 from .base import GPIOInterface, RelayConfig, RelayName
 
@@ -24,6 +25,7 @@ class RaspberryPiGPIO(GPIOInterface):
     def __init__(self) -> None:
         self._configs: dict[RelayName, RelayConfig] = {}
         self._states: dict[RelayName, bool] = {}
+        self._states_view: Mapping[RelayName, bool] = MappingProxyType(self._states)
         self._gpio: Any = None
 
     async def setup(self, relay_configs: dict[RelayName, RelayConfig]) -> None:
@@ -76,17 +78,45 @@ class RaspberryPiGPIO(GPIOInterface):
         # Active low: 0 = ON, 1 = OFF
         pin_value = 0 if on else 1
 
-        # Run GPIO output in executor to avoid blocking
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(
-            None,
-            self._gpio.output,
-            config.gpio_pin,
-            pin_value,
-        )
+        # GPIO.output is a memory-mapped register write taking microseconds,
+        # far less than an executor round trip, so it runs inline
+        self._gpio.output(config.gpio_pin, pin_value)
 
         self._states[relay] = on
-        logger.debug("Relay %s: %s", relay.value, "ON" if on else "OFF")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Relay %s: %s", relay.value, "ON" if on else "OFF")
+
+    async def set_relays(self, states: Mapping[RelayName, bool]) -> None:
+        """Set several relay states with a single GPIO.output call.
+
+        Args:
+            states: Mapping of relays to their new states (True=ON).
+
+        Raises:
+            ValueError: If a relay was not configured during setup.
+        """
+        channels = []
+        values = []
+        for relay, on in states.items():
+            config = self._configs.get(relay)
+            if config is None:
+                raise ValueError(f"Unknown relay: {relay}")
+            channels.append(config.gpio_pin)
+            values.append(0 if on else 1)  # Active low
+
+        if not channels:
+            return
+
+        # RPi.GPIO.output accepts parallel lists of channels and values;
+        # like set_relay, the write is fast enough to run inline
+        self._gpio.output(channels, values)
+
+        self._states.update(states)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Relays %s",
+                ", ".join(f"{r.value}={'ON' if on else 'OFF'}" for r, on in states.items()),
+            )
 
     async def get_relay(self, relay: RelayName) -> bool:
         """Get current relay state.
@@ -99,13 +129,13 @@ class RaspberryPiGPIO(GPIOInterface):
         """
         return self._states.get(relay, False)
 
-    async def get_all_relays(self) -> dict[RelayName, bool]:
+    async def get_all_relays(self) -> Mapping[RelayName, bool]:
         """Get all relay states.
 
         Returns:
-            Mapping of relay names to their current states.
+            Read-only live view of relay names to their current states.
         """
-        return dict(self._states)
+        return self._states_view
 
     async def cleanup(self) -> None:
         """Clean up GPIO resources.
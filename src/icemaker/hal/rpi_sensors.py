@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from .base import SensorName, TemperatureSensorInterface
 
@@ -23,6 +25,13 @@ class RaspberryPiSensors(TemperatureSensorInterface):
 
     def __init__(self) -> None:
         self._sensors: dict[SensorName, Any] = {}
+        # One worker per sensor so conversions run in parallel without
+        # queueing behind unrelated work in the loop's default executor
+        self._executor: Optional[ThreadPoolExecutor] = None
+        # Per-sensor read callables and w1thermsensor's read errors, bound in
+        # setup() so reads do no imports or closure allocation
+        self._readers: dict[SensorName, Callable[[], float]] = {}
+        self._read_errors: tuple[type[Exception], ...] = ()
 
     async def setup(self, sensor_ids: dict[SensorName, str]) -> None:
         """Initialize temperature sensors.
@@ -30,12 +39,15 @@ class RaspberryPiSensors(TemperatureSensorInterface):
         Args:
             sensor_ids: Mapping of sensor names to their hardware IDs.
         """
-        from w1thermsensor import W1ThermSensor
+        from w1thermsensor import Unit, W1ThermSensor
         from w1thermsensor.errors import SensorNotReadyError, NoSensorFoundError
 
+        self._read_errors = (SensorNotReadyError, NoSensorFoundError)
         for name, sensor_id in sensor_ids.items():
             try:
-                self._sensors[name] = W1ThermSensor(sensor_id=sensor_id)
+                sensor = W1ThermSensor(sensor_id=sensor_id)
+                self._sensors[name] = sensor
+                self._readers[name] = partial(sensor.get_temperature, Unit.DEGREES_F)
                 logger.info(
                     "Initialized sensor %s with ID %s",
                     name.value,
@@ -57,6 +69,13 @@ class RaspberryPiSensors(TemperatureSensorInterface):
                     e,
                 )
 
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self._sensors)),
+            thread_name_prefix="w1-sensor",
+        )
+
         logger.info(
             "RaspberryPiSensors initialized with %d/%d sensors",
             len(self._sensors),
@@ -78,23 +97,17 @@ class RaspberryPiSensors(TemperatureSensorInterface):
         Raises:
             ValueError: If sensor was not configured during setup.
         """
-        from w1thermsensor import Unit
-        from w1thermsensor.errors import SensorNotReadyError, NoSensorFoundError
-
-        sensor_obj = self._sensors.get(sensor)
-        if sensor_obj is None:
+        reader = self._readers.get(sensor)
+        if reader is None:
             logger.warning("Sensor %s not initialized, returning default temp", sensor.value)
             return 70.0  # Return room temp as fallback
 
         try:
             # Run blocking I/O in executor
-            loop = asyncio.get_event_loop()
-            temp = await loop.run_in_executor(
-                None,
-                lambda: sensor_obj.get_temperature(Unit.DEGREES_F),
-            )
+            loop = asyncio.get_running_loop()
+            temp = await loop.run_in_executor(self._executor, reader)
             return float(temp)
-        except (SensorNotReadyError, NoSensorFoundError) as e:
+        except self._read_errors as e:
             logger.warning("Failed to read sensor %s: %s", sensor.value, e)
             return 70.0  # Return room temp as fallback
         except Exception as e:
@@ -104,10 +117,23 @@ class RaspberryPiSensors(TemperatureSensorInterface):
     async def read_all_temperatures(self) -> dict[SensorName, float]:
         """Read all sensor temperatures.
 
+        Sensors are read concurrently, so a poll takes as long as the
+        slowest DS18B20 conversion rather than the sum of all of them.
+
         Returns:
             Mapping of sensor names to temperatures in Fahrenheit.
         """
-        results: dict[SensorName, float] = {}
-        for name in self._sensors:
-            results[name] = await self.read_temperature(name)
-        return results
+        names = tuple(self._sensors)
+        temps = await asyncio.gather(*[self.read_temperature(name) for name in names])
+        return dict(zip(names, temps))
+
+    async def cleanup(self) -> None:
+        """Shut down the sensor read thread pool.
+
+        Does not wait for reads still running in worker threads, since a
+        stuck 1-Wire read cannot be interrupted.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        logger.info("RaspberryPiSensors cleanup complete")
@@ -12,7 +12,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Mapping, Optional
 
 from ..hal.base import RelayName, SensorName
 
@@ -37,6 +37,32 @@ def kelvin_to_fahrenheit(k: float) -> float:
     return (k - 273.15) * 9 / 5 + 32
 
 
+# Density of ice (kg/m³)
+ICE_DENSITY: float = 917.0
+
+
+def heat_transfer(h: float, area: float, t1_f: float, t2_f: float, dt: float) -> float:
+    """Calculate heat transfer between two bodies.
+
+    Q = h * A * (T1 - T2) * dt
+
+    Called several times per physics tick, so it is a plain function taking
+    positional arguments rather than a method.
+
+    Args:
+        h: Heat transfer coefficient (W/m²·K)
+        area: Contact area (m²)
+        t1_f: Temperature of body 1 in Fahrenheit
+        t2_f: Temperature of body 2 in Fahrenheit
+        dt: Time step in seconds
+
+    Returns:
+        Heat transferred in Joules (positive = heat flows from T1 to T2)
+    """
+    # ΔT(K) = ΔT(F) * 5/9; Q = h * A * ΔT * dt (in Joules, since h is in W/m²·K)
+    return h * area * ((t1_f - t2_f) * 5 / 9) * dt
+
+
 @dataclass
 class SimulatorParams:
     """Parameters for the physics simulation.
@@ -271,8 +297,9 @@ class IceBin:
             mass_kg: Mass of ice to add in kg
         """
         self.ice_mass_kg = min(self.max_ice_mass_kg, self.ice_mass_kg + mass_kg)
-        logger.debug("Bin ice: added %.3f kg, total %.3f kg (%.0f%% full)",
-                     mass_kg, self.ice_mass_kg, self.fill_fraction * 100)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Bin ice: added %.3f kg, total %.3f kg (%.0f%% full)",
+                         mass_kg, self.ice_mass_kg, self.fill_fraction * 100)
 
     def melt_ice(self, energy_joules: float) -> float:
         """Melt ice in the bin due to heat input.
@@ -373,6 +400,7 @@ class PhysicsSimulator:
         self._accumulated_time: float = 0.0  # Partial tick accumulator
         self._running = False
         self._update_task: Optional[asyncio.Task[None]] = None
+        self._time_advanced_callback: Optional[Callable[[], None]] = None
 
     # -------------------------------------------------------------------------
     # HAL Interface Methods (called by MockGPIO/MockSensors)
@@ -382,6 +410,10 @@ class PhysicsSimulator:
         """Set relay state - called by MockGPIO callback."""
         self._relay_states[relay] = on
 
+    def set_relay_states(self, changes: Mapping[RelayName, bool]) -> None:
+        """Set several relay states - called by MockGPIO batch callback."""
+        self._relay_states.update(changes)
+
     def get_temperature(self, sensor: SensorName) -> float:
         """Get temperature - called by MockSensors provider."""
         if sensor == SensorName.PLATE:
@@ -399,6 +431,14 @@ class PhysicsSimulator:
         """Get elapsed simulated time in seconds."""
         return self.simulated_time_seconds
 
+    def set_time_advanced_callback(self, callback: Optional[Callable[[], None]]) -> None:
+        """Set a function called whenever the background loop advances simulated time.
+
+        Args:
+            callback: Plain function taking no arguments, or None to clear.
+        """
+        self._time_advanced_callback = callback
+
     def set_speed_multiplier(self, multiplier: float) -> None:
         """Set simulation speed multiplier."""
         multiplier = max(0.1, min(1000.0, multiplier))
@@ -476,35 +516,6 @@ class PhysicsSimulator:
     # Physics Calculations
     # -------------------------------------------------------------------------
 
-    def _calculate_heat_transfer(
-        self,
-        h: float,
-        area: float,
-        t1_f: float,
-        t2_f: float,
-        dt: float,
-    ) -> float:
-        """Calculate heat transfer between two bodies.
-
-        Q = h * A * (T1 - T2) * dt
-
-        Args:
-            h: Heat transfer coefficient (W/m²·K)
-            area: Contact area (m²)
-            t1_f: Temperature of body 1 in Fahrenheit
-            t2_f: Temperature of body 2 in Fahrenheit
-            dt: Time step in seconds
-
-        Returns:
-            Heat transferred in Joules (positive = heat flows from T1 to T2)
-        """
-        # Convert temperature difference to Kelvin
-        # ΔT(K) = ΔT(F) * 5/9
-        delta_t_k = (t1_f - t2_f) * 5 / 9
-
-        # Q = h * A * ΔT * dt (in Joules, since h is in W/m²·K)
-        return h * area * delta_t_k * dt
-
     def _update_physics(self, dt: float) -> None:
         """Update physics for one time step.
 
@@ -530,7 +541,6 @@ class PhysicsSimulator:
         # ---------------------------------------------------------------------
         if pump_on:
             # Physical constants for ice
-            ice_density = 917.0  # kg/m³
             k_ice = p.ice_thermal_conductivity  # 2.2 W/(m·K)
 
             # Check conditions for ice formation
@@ -576,26 +586,26 @@ class PhysicsSimulator:
 
                 # Update ice thickness from total mass
                 self.ice_thickness_m = self.ice_mass_kg / (
-                    ice_density * p.plate_water_contact_area
+                    ICE_DENSITY * p.plate_water_contact_area
                 )
 
                 # Clamp to max thickness
                 if self.ice_thickness_m > p.max_ice_thickness_m:
                     self.ice_thickness_m = p.max_ice_thickness_m
                     self.ice_mass_kg = (
-                        self.ice_thickness_m * ice_density * p.plate_water_contact_area
+                        self.ice_thickness_m * ICE_DENSITY * p.plate_water_contact_area
                     )
 
                 # Water releases latent heat but stays at freezing point
                 # (phase change absorbs energy without temperature change)
                 if self.reservoir.temp_f > p.freezing_point_f:
                     # Cool water down to freezing point
-                    q_to_freezing = self._calculate_heat_transfer(
-                        h=p.h_water_plate,
-                        area=p.plate_water_contact_area,
-                        t1_f=self.reservoir.temp_f,
-                        t2_f=p.freezing_point_f,
-                        dt=dt,
+                    q_to_freezing = heat_transfer(
+                        p.h_water_plate,
+                        p.plate_water_contact_area,
+                        self.reservoir.temp_f,
+                        p.freezing_point_f,
+                        dt,
                     )
                     self.reservoir.apply_heat_transfer(-q_to_freezing)
                     if self.reservoir.temp_f < p.freezing_point_f:
@@ -614,12 +624,12 @@ class PhysicsSimulator:
 
                 h_effective = self._get_effective_h_through_ice()
 
-                q_water_plate = self._calculate_heat_transfer(
-                    h=h_effective,
-                    area=p.plate_water_contact_area,
-                    t1_f=self.reservoir.temp_f,
-                    t2_f=self.plate.temp_f,
-                    dt=dt,
+                q_water_plate = heat_transfer(
+                    h_effective,
+                    p.plate_water_contact_area,
+                    self.reservoir.temp_f,
+                    self.plate.temp_f,
+                    dt,
                 )
 
                 # Heat flows from warmer to cooler
@@ -631,12 +641,12 @@ class PhysicsSimulator:
         # ---------------------------------------------------------------------
         if compressor_on and not hot_gas_on:
             # Plate is cooled by refrigerant evaporator
-            q_refrigerant = self._calculate_heat_transfer(
-                h=p.h_refrigerant,
-                area=p.evaporator_area,
-                t1_f=self.plate.temp_f,
-                t2_f=p.refrigerant_temp_f,
-                dt=dt,
+            q_refrigerant = heat_transfer(
+                p.h_refrigerant,
+                p.evaporator_area,
+                self.plate.temp_f,
+                p.refrigerant_temp_f,
+                dt,
             )
             # Positive Q means plate is warmer than refrigerant, plate loses heat
             self.plate.apply_heat_transfer(-q_refrigerant)
@@ -646,20 +656,18 @@ class PhysicsSimulator:
         # ---------------------------------------------------------------------
         if compressor_on and hot_gas_on:
             # Plate is heated by hot gas bypass
-            q_hotgas = self._calculate_heat_transfer(
-                h=p.h_hotgas,
-                area=p.evaporator_area,
-                t1_f=p.hot_gas_temp_f,
-                t2_f=self.plate.temp_f,
-                dt=dt,
+            q_hotgas = heat_transfer(
+                p.h_hotgas,
+                p.evaporator_area,
+                p.hot_gas_temp_f,
+                self.plate.temp_f,
+                dt,
             )
 
             # During harvest, ice melts as plate heats
             # Heat goes into melting ice (latent heat) until plate reaches 32°F
             # Ice melts from the plate side first (where heat is applied)
             if self.ice_mass_kg > 0:
-                ice_density = 917.0
-
                 # While there's ice and plate is below/at freezing, energy goes to melting
                 # The plate-ice interface must reach 32°F for ice to release
                 if self.plate.temp_f <= p.freezing_point_f + 2.0:
@@ -673,7 +681,7 @@ class PhysicsSimulator:
                     # Update thickness
                     if self.ice_mass_kg > 0:
                         self.ice_thickness_m = self.ice_mass_kg / (
-                            ice_density * p.plate_water_contact_area
+                            ICE_DENSITY * p.plate_water_contact_area
                         )
                     else:
                         self.ice_thickness_m = 0.0
@@ -714,12 +722,12 @@ class PhysicsSimulator:
         # ---------------------------------------------------------------------
         if self.ice_bin.ice_mass_kg > 0:
             # Heat transfer from ambient air to ice bin
-            q_bin_ambient = self._calculate_heat_transfer(
-                h=self.ice_bin.H_AMBIENT,
-                area=self.ice_bin.BIN_SURFACE_AREA,
-                t1_f=p.ambient_temp_f,
-                t2_f=32.0,  # Ice surface at freezing point
-                dt=dt,
+            q_bin_ambient = heat_transfer(
+                self.ice_bin.H_AMBIENT,
+                self.ice_bin.BIN_SURFACE_AREA,
+                p.ambient_temp_f,
+                32.0,  # Ice surface at freezing point
+                dt,
             )
             if q_bin_ambient > 0:
                 self.ice_bin.melt_ice(q_bin_ambient)
@@ -731,23 +739,23 @@ class PhysicsSimulator:
         # 7. Ambient heat loss/gain
         # ---------------------------------------------------------------------
         # Reservoir drifts toward ambient
-        q_reservoir_ambient = self._calculate_heat_transfer(
-            h=p.h_ambient_water,
-            area=p.reservoir_surface_area,
-            t1_f=p.ambient_temp_f,
-            t2_f=self.reservoir.temp_f,
-            dt=dt,
+        q_reservoir_ambient = heat_transfer(
+            p.h_ambient_water,
+            p.reservoir_surface_area,
+            p.ambient_temp_f,
+            self.reservoir.temp_f,
+            dt,
         )
         self.reservoir.apply_heat_transfer(+q_reservoir_ambient)
 
         # Plate drifts toward ambient (when not actively cooled/heated)
         if not compressor_on:
-            q_plate_ambient = self._calculate_heat_transfer(
-                h=p.h_ambient_plate,
-                area=p.plate_ambient_area,
-                t1_f=p.ambient_temp_f,
-                t2_f=self.plate.temp_f,
-                dt=dt,
+            q_plate_ambient = heat_transfer(
+                p.h_ambient_plate,
+                p.plate_ambient_area,
+                p.ambient_temp_f,
+                self.plate.temp_f,
+                dt,
             )
             self.plate.apply_heat_transfer(+q_plate_ambient)
 
@@ -815,7 +823,13 @@ class PhysicsSimulator:
         while self._running:
             # Use fixed update_interval for deterministic behavior
             # rather than measuring actual elapsed time which varies with system load
+            previous_time = self.simulated_time_seconds
             self.update(update_interval)
+            if (
+                self._time_advanced_callback is not None
+                and self.simulated_time_seconds != previous_time
+            ):
+                self._time_advanced_callback()
 
             # Periodic logging
             if self.simulated_time_seconds - last_log_time >= log_interval:
@@ -43,6 +43,7 @@ def create_simulated_hal(
     # Create mock GPIO connected to simulator
     gpio = MockGPIO()
     gpio.set_change_callback(simulator.set_relay_state)
+    gpio.set_batch_change_callback(simulator.set_relay_states)
 
     # Create mock sensors connected to simulator
     sensors = MockSensors()
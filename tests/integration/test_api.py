@@ -3,9 +3,10 @@
 import pytest
 from httpx import ASGITransport, AsyncClient
 
-from icemaker.api.app import app, app_state
+from icemaker.api.app import _event_handler, app, app_state
 from icemaker.config import IcemakerConfig, StateConfig
 from icemaker.core.controller import IcemakerController
+from icemaker.core.events import temp_reading_event
 from icemaker.core.states import IcemakerState
 from icemaker.simulator.simulated_hal import create_simulated_hal
 
@@ -221,3 +222,28 @@ class TestConfigEndpoints:
         data = response.json()
         assert data["prechill_temp"] == 30.0
         assert data["bin_full_threshold"] == 40.0
+
+
+class TestEventBroadcasts:
+    """Test WebSocket broadcasts driven by controller events."""
+
+    @pytest.mark.asyncio
+    async def test_temp_reading_broadcasts_full_update(
+        self, test_client: AsyncClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """TEMP_READING events should carry the simulator and state fields."""
+        sent: list = []
+
+        async def fake_broadcast(*args) -> None:
+            sent.append(args)
+
+        monkeypatch.setattr(app_state.ws_manager, "broadcast_temp_update", fake_broadcast)
+        await _event_handler(temp_reading_event(40.0, 50.0))
+
+        plate, bin_temp, water, target, simulated_time, time_in_state = sent[0]
+        assert (plate, bin_temp) == (40.0, 50.0)
+        assert water is not None
+        assert target == app_state.controller.fsm.context.target_temp
+        assert simulated_time is not None
+        assert time_in_state >= 0
+
@@ -5,8 +5,14 @@ import asyncio
 import pytest
 
 from icemaker.config import IcemakerConfig, StateConfig
-from icemaker.core.controller import IcemakerController
-from icemaker.core.states import IcemakerState
+from icemaker.core.controller import (
+    MAX_POLL_INTERVAL,
+    MAX_SENSOR_ERROR_BACKOFF,
+    IcemakerController,
+    sensor_error_delay,
+)
+from icemaker.core.events import Event, EventType
+from icemaker.core.states import ChillMode, IcemakerState
 from icemaker.hal.base import RelayName
 from icemaker.simulator.simulated_hal import create_simulated_hal
 from icemaker.simulator.thermal_model import ThermalParameters
@@ -212,6 +218,42 @@ class TestHeatState:
 
         await controller.stop()
 
+    @pytest.mark.asyncio
+    async def test_heat_closes_water_valve_after_fill_time(
+        self, fast_config: IcemakerConfig
+    ) -> None:
+        """HEAT should close the water valve once harvest fill time expires."""
+        gpio, sensors, model = create_simulated_hal()
+        controller = IcemakerController(
+            config=fast_config,
+            gpio=gpio,
+            sensors=sensors,
+            thermal_model=model,
+        )
+
+        await controller.initialize()
+        controller.fsm.context.plate_temp = 10.0
+
+        await controller.fsm.transition_to(IcemakerState.CHILL)
+        await controller.fsm.transition_to(IcemakerState.ICE)
+        await controller.fsm.transition_to(IcemakerState.HEAT)
+
+        # First tick opens the valve
+        ctx = controller.fsm.context
+        await controller._handle_heat(controller.fsm, ctx)
+        ctx.state_entered = False
+        assert await gpio.get_relay(RelayName.WATER_VALVE) is True
+
+        # Pretend the fill time has elapsed
+        ctx.simulated_state_enter_time = (
+            model.get_simulated_time() - fast_config.harvest_fill_time - 1
+        )
+        await controller._handle_heat(controller.fsm, ctx)
+        assert await gpio.get_relay(RelayName.WATER_VALVE) is False
+        assert ctx.harvest_fill_done
+
+        await controller.stop()
+
 
 class TestSimulatedCycle:
     """Test full cycle with simulated thermal model."""
@@ -251,3 +293,256 @@ class TestSimulatedCycle:
 
         await model.stop()
         await controller.stop()
+
+
+class TestRelayCache:
+    """Test skipping of redundant relay writes."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_relay_write_emits_one_event(
+        self, fast_config: IcemakerConfig
+    ) -> None:
+        """Setting a relay to its current state should not emit an event."""
+        gpio, sensors, model = create_simulated_hal()
+        controller = IcemakerController(
+            config=fast_config,
+            gpio=gpio,
+            sensors=sensors,
+            thermal_model=model,
+        )
+        events: list = []
+
+        async def listener(event):
+            events.append(event)
+
+        controller.add_event_listener(listener)
+        await controller.initialize()
+
+        await controller._set_relay(RelayName.COMPRESSOR_1, True)
+        await controller._set_relay(RelayName.COMPRESSOR_1, True)
+        assert len(events) == 1
+
+        # Direct GPIO writes require invalidating the cache
+        await gpio.set_relay(RelayName.COMPRESSOR_1, False)
+        controller.invalidate_relay_cache()
+        await controller._set_relay(RelayName.COMPRESSOR_1, True)
+        assert len(events) == 2
+        assert await gpio.get_relay(RelayName.COMPRESSOR_1) is True
+
+        await controller.stop()
+
+    @pytest.mark.asyncio
+    async def test_relay_pattern_writes_only_changes(
+        self, fast_config: IcemakerConfig
+    ) -> None:
+        """Re-applying a relay pattern should emit nothing; switching emits the diff."""
+        gpio, sensors, model = create_simulated_hal()
+        controller = IcemakerController(
+            config=fast_config,
+            gpio=gpio,
+            sensors=sensors,
+            thermal_model=model,
+        )
+        events: list = []
+
+        async def listener(event):
+            events.append(event)
+
+        controller.add_event_listener(listener)
+        await controller.initialize()
+
+        await controller._set_cooling_relays(with_recirculation=True)
+        await controller._set_cooling_relays(with_recirculation=True)
+        assert len(events) == 1
+
+        await controller._set_cooling_relays(with_recirculation=False)
+        assert events[-1].data == {"states": {"recirculating_pump": False}}
+        assert await gpio.get_relay(RelayName.RECIRCULATING_PUMP) is False
+
+        await controller.stop()
+
+    @pytest.mark.asyncio
+    async def test_power_on_restores_relays_after_invalidation(
+        self, fast_config: IcemakerConfig
+    ) -> None:
+        """POWER_ON should re-apply its phase relays after a direct GPIO write."""
+        gpio, sensors, model = create_simulated_hal()
+        controller = IcemakerController(
+            config=fast_config,
+            gpio=gpio,
+            sensors=sensors,
+            thermal_model=model,
+        )
+        await controller.initialize()
+        fsm = controller.fsm
+        await fsm.transition_to(IcemakerState.POWER_ON)
+
+        await controller._handle_power_on(fsm, fsm.context)
+        fsm.context.state_entered = False
+        assert await gpio.get_relay(RelayName.WATER_VALVE) is True
+
+        # Manual override from the API, still within the flush phase
+        await gpio.set_relay(RelayName.WATER_VALVE, False)
+        controller.invalidate_relay_cache()
+        await controller._handle_power_on(fsm, fsm.context)
+        assert await gpio.get_relay(RelayName.WATER_VALVE) is True
+
+        await controller.stop()
+
+
+class TestCycleCountPersistence:
+    """Test lifetime cycle count persistence."""
+
+    def test_cycle_count_round_trip(self, fast_config: IcemakerConfig, tmp_path) -> None:
+        """Saved cycle count should be loaded by a new controller."""
+        fast_config.data_dir = str(tmp_path)
+        controller = IcemakerController(config=fast_config)
+        controller.fsm.context.cycle_count = 42
+        controller._save_cycle_count()
+
+        assert not (tmp_path / "cycle_count.tmp").exists()
+
+        reloaded = IcemakerController(config=fast_config)
+        reloaded._load_cycle_count()
+        assert reloaded.fsm.context.cycle_count == 42
+
+
+class TestSensorPolling:
+    """Test adaptive sensor poll scheduling."""
+
+    def test_first_poll_uses_full_interval(self, fast_config: IcemakerConfig) -> None:
+        """Without a previous sample the full poll interval should be used."""
+        controller = IcemakerController(config=fast_config)
+        assert controller._next_poll_delay() == fast_config.poll_interval
+
+    def test_poll_delay_shrinks_near_target(self) -> None:
+        """Delay should shrink when the plate is about to reach its target."""
+        config = IcemakerConfig()
+        config.poll_interval = 5.0
+        controller = IcemakerController(config=config)
+        ctx = controller.fsm.context
+        controller._poll_target = 32.0
+
+        ctx.plate_temp = 33.0
+        controller._next_poll_delay()
+        controller._last_sample_time -= 1.0  # One second since last sample
+        ctx.plate_temp = 32.5
+
+        assert controller._next_poll_delay() < config.poll_interval
+
+    def test_poll_delay_full_when_moving_away(self) -> None:
+        """Delay should stay at poll_interval when moving away from target."""
+        config = IcemakerConfig()
+        config.poll_interval = 5.0
+        controller = IcemakerController(config=config)
+        ctx = controller.fsm.context
+        controller._poll_target = 32.0
+
+        ctx.plate_temp = 40.0
+        controller._next_poll_delay()
+        controller._last_sample_time -= 1.0
+        ctx.plate_temp = 41.0
+
+        assert controller._next_poll_delay() == config.poll_interval
+
+    def test_poll_delay_grows_far_from_target(self) -> None:
+        """Delay should exceed poll_interval while the target is far away."""
+        config = IcemakerConfig()
+        config.poll_interval = 5.0
+        controller = IcemakerController(config=config)
+        ctx = controller.fsm.context
+        controller._poll_target = 32.0
+
+        ctx.plate_temp = 70.0
+        controller._next_poll_delay()
+        controller._last_sample_time -= 1.0
+        ctx.plate_temp = 69.9
+
+        delay = controller._next_poll_delay()
+        assert config.poll_interval < delay <= MAX_POLL_INTERVAL
+
+    def test_poll_delay_full_without_target(self) -> None:
+        """States without a target should poll at poll_interval."""
+        config = IcemakerConfig()
+        config.poll_interval = 5.0
+        controller = IcemakerController(config=config)
+        ctx = controller.fsm.context
+        controller._poll_target = None
+
+        ctx.plate_temp = 70.0
+        controller._next_poll_delay()
+        controller._last_sample_time -= 1.0
+        ctx.plate_temp = 69.9
+
+        assert controller._next_poll_delay() == config.poll_interval
+
+    def test_target_temp_for_state(self, fast_config: IcemakerConfig) -> None:
+        """Poll targets should follow the configured state targets."""
+        controller = IcemakerController(config=fast_config)
+        assert controller.target_temp_for_state(IcemakerState.CHILL) == 50.0
+        controller.fsm.context.chill_mode = ChillMode.RECHILL
+        assert controller.target_temp_for_state(IcemakerState.CHILL) == 45.0
+        assert controller.target_temp_for_state(IcemakerState.ICE) == 30.0
+        assert controller.target_temp_for_state(IcemakerState.HEAT) == 60.0
+        assert controller.target_temp_for_state(IcemakerState.POWER_ON) is None
+
+    def test_sensor_error_delay_backs_off(self) -> None:
+        """Error back-off should double per error and stay capped."""
+        assert sensor_error_delay(1.0, 1) == 2.0
+        assert sensor_error_delay(1.0, 3) == 8.0
+        assert sensor_error_delay(1.0, 100) == MAX_SENSOR_ERROR_BACKOFF
+
+    @pytest.mark.asyncio
+    async def test_full_rate_polling_follows_state(
+        self, fast_config: IcemakerConfig
+    ) -> None:
+        """Full-rate polling should follow the states that act on readings."""
+        gpio, sensors, model = create_simulated_hal()
+        controller = IcemakerController(
+            config=fast_config,
+            gpio=gpio,
+            sensors=sensors,
+            thermal_model=model,
+        )
+        await controller.initialize()
+        assert not controller._polling_active.is_set()
+
+        await controller.start_icemaking()
+        assert controller._polling_active.is_set()
+
+        # IDLE watches the bin temperature to restart the cycle
+        await controller.fsm.transition_to(IcemakerState.IDLE)
+        assert controller._polling_active.is_set()
+
+        await controller.fsm.transition_to(IcemakerState.STANDBY)
+        assert not controller._polling_active.is_set()
+        await controller.stop()
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop_sensor_polling(
+        self, fast_config: IcemakerConfig
+    ) -> None:
+        """The polling task should update readings and emit TEMP_READING events."""
+        gpio, sensors, model = create_simulated_hal()
+        controller = IcemakerController(
+            config=fast_config,
+            gpio=gpio,
+            sensors=sensors,
+            thermal_model=model,
+        )
+        await controller.initialize()
+
+        readings: asyncio.Queue = asyncio.Queue()
+
+        async def listener(event: Event) -> None:
+            if event.type == EventType.TEMP_READING:
+                readings.put_nowait(event)
+
+        controller.add_event_listener(listener)
+        controller.start_sensor_polling()
+        event = await asyncio.wait_for(readings.get(), timeout=1.0)
+        assert event.data["plate_temp"] == controller.fsm.context.plate_temp
+
+        await controller.stop_sensor_polling()
+        assert controller._sensor_task is None
+        await controller.stop()
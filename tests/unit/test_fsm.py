@@ -1,8 +1,10 @@
 """Tests for async FSM."""
 
+import asyncio
+
 import pytest
 
-from icemaker.core.events import EventType
+from icemaker.core.events import Event, EventType
 from icemaker.core.fsm import AsyncFSM
 from icemaker.core.states import IcemakerState
 
@@ -134,6 +136,23 @@ class TestFSMEvents:
         assert len(exit_events) == 1
         assert exit_events[0].data["state"] == "IDLE"
 
+    @pytest.mark.asyncio
+    async def test_exit_delivered_before_state_change(self, fsm: AsyncFSM) -> None:
+        """STATE_EXIT should finish, in the old state, before STATE_ENTER."""
+        seen: list = []
+
+        async def listener(event):
+            await asyncio.sleep(0)
+            seen.append((event.type, fsm.state))
+
+        fsm.add_listener(listener)
+        await fsm.transition_to(IcemakerState.CHILL)
+
+        assert seen == [
+            (EventType.STATE_EXIT, IcemakerState.IDLE),
+            (EventType.STATE_ENTER, IcemakerState.CHILL),
+        ]
+
     @pytest.mark.asyncio
     async def test_listener_can_be_removed(self, fsm: AsyncFSM) -> None:
         """Removed listener should not receive events."""
@@ -148,6 +167,96 @@ class TestFSMEvents:
 
         assert len(events) == 0
 
+    @pytest.mark.asyncio
+    async def test_listener_removed_during_emit(self, fsm: AsyncFSM) -> None:
+        """Removing a listener mid-emit should not skip the next listener."""
+        events: list = []
+
+        async def one_shot(event):
+            fsm.remove_listener(one_shot)
+
+        async def listener(event):
+            events.append(event)
+
+        fsm.add_listener(one_shot)
+        fsm.add_listener(listener)
+        await fsm.transition_to(IcemakerState.CHILL)
+
+        assert [(e.type, e.data["state"]) for e in events] == [
+            (EventType.STATE_EXIT, "IDLE"),
+            (EventType.STATE_ENTER, "CHILL"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failing_listener_does_not_block_others(self, fsm: AsyncFSM) -> None:
+        """A listener that raises should not stop delivery to the rest."""
+        events: list = []
+
+        async def failing(event):
+            raise RuntimeError("boom")
+
+        async def listener(event):
+            events.append(event)
+
+        fsm.add_listener(failing)
+        fsm.add_listener(listener)
+        await fsm.transition_to(IcemakerState.CHILL)
+
+        assert [e.type for e in events] == [EventType.STATE_EXIT, EventType.STATE_ENTER]
+
+    @pytest.mark.asyncio
+    async def test_force_state_emits_given_event(self, fsm: AsyncFSM) -> None:
+        """force_state should bypass the transition table and emit its event."""
+        events: list = []
+
+        async def listener(event):
+            events.append(event)
+
+        fsm.add_listener(listener)
+        await fsm.force_state(
+            IcemakerState.OFF,
+            Event(type=EventType.EMERGENCY_STOP, source="controller"),
+        )
+
+        assert fsm.state == IcemakerState.OFF
+        assert fsm.previous_state == IcemakerState.IDLE
+        assert [e.type for e in events] == [EventType.EMERGENCY_STOP]
+
+    @pytest.mark.asyncio
+    async def test_state_timeout_event_emitted(self) -> None:
+        """Handlers running past the state timeout should emit STATE_TIMEOUT."""
+        fsm = AsyncFSM(initial_state=IcemakerState.OFF, poll_interval=10.0)
+        events: list[Event] = []
+
+        async def listener(event: Event) -> None:
+            events.append(event)
+
+        async def handler(fsm: AsyncFSM, ctx: object) -> None:
+            fsm._running = False
+            return None
+
+        fsm.add_listener(listener)
+        fsm.register_handler(IcemakerState.SHUTDOWN, handler)
+        await fsm.transition_to(IcemakerState.SHUTDOWN)
+        fsm.context.state_enter_time -= 60.0
+        fsm.wake()
+        await asyncio.wait_for(fsm.run(), timeout=1.0)
+
+        timeouts = [e for e in events if e.type == EventType.STATE_TIMEOUT]
+        assert len(timeouts) == 1
+        assert timeouts[0].data["state"] == "SHUTDOWN"
+
+    @pytest.mark.asyncio
+    async def test_wait_for_state_change(self, fsm: AsyncFSM) -> None:
+        """wait_for_state_change should resolve on transition or time out."""
+        assert await fsm.wait_for_state_change(timeout=0.01) is False
+
+        waiter = asyncio.create_task(fsm.wait_for_state_change(timeout=1.0))
+        await asyncio.sleep(0)
+        await fsm.transition_to(IcemakerState.CHILL)
+
+        assert await waiter is True
+
 
 class TestFSMContext:
     """Test FSM context management."""
@@ -166,7 +275,75 @@ class TestFSMContext:
         await fsm.transition_to(IcemakerState.CHILL)
         assert fsm.context.state_enter_time > initial_time
 
+    @pytest.mark.asyncio
+    async def test_external_transition_during_handler_keeps_entry_flag(self) -> None:
+        """A transition made while a handler awaits should start the new state fresh."""
+        fsm = AsyncFSM(initial_state=IcemakerState.CHILL, poll_interval=10.0)
+        gate = asyncio.Event()
+        handler_done = asyncio.Event()
+
+        async def chill_handler(fsm: AsyncFSM, ctx) -> None:
+            ctx.state_params = (32.0, 120.0)
+            ctx.harvest_fill_done = True
+            await gate.wait()
+            handler_done.set()
+            return None
+
+        fsm.register_handler(IcemakerState.CHILL, chill_handler)
+        task = asyncio.create_task(fsm.run())
+        await asyncio.sleep(0)
+
+        await fsm.transition_to(IcemakerState.ICE)
+        gate.set()
+        await asyncio.wait_for(handler_done.wait(), timeout=1.0)
+        await asyncio.sleep(0)
+
+        ctx = fsm.context
+        assert fsm.state == IcemakerState.ICE
+        assert ctx.state_entered is True
+        assert ctx.state_params == ()
+        assert ctx.harvest_fill_done is False
+
+        await fsm.stop()
+        fsm.wake()
+        await asyncio.wait_for(task, timeout=1.0)
+
     def test_time_in_state(self, fsm: AsyncFSM) -> None:
         """time_in_state should return elapsed seconds."""
         time_elapsed = fsm.time_in_state()
         assert time_elapsed >= 0
+
+
+class TestFSMWakeup:
+    """Test waking the FSM loop early."""
+
+    @pytest.mark.asyncio
+    async def test_wake_interrupts_poll_wait(self) -> None:
+        """wake() should end the poll wait before poll_interval elapses."""
+        fsm = AsyncFSM(initial_state=IcemakerState.OFF, poll_interval=10.0)
+        fsm._running = True
+
+        waiter = asyncio.create_task(fsm._wait_for_next_poll())
+        await asyncio.sleep(0)
+        fsm.wake()
+
+        await asyncio.wait_for(waiter, timeout=1.0)
+
+    @pytest.mark.asyncio
+    async def test_lockstep_wait_follows_simulated_time(self) -> None:
+        """Lockstep waits should end once notified time reaches the next poll."""
+        sim_time = 0.0
+        fsm = AsyncFSM(initial_state=IcemakerState.OFF, poll_interval=5.0)
+        fsm.set_simulated_time_getter(lambda: sim_time)
+        fsm._running = True
+
+        waiter = asyncio.create_task(fsm._wait_for_next_poll())
+        await asyncio.sleep(0)
+        sim_time = 2.0
+        fsm.notify_simulated_time_advanced()
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        sim_time = 5.0
+        fsm.notify_simulated_time_advanced()
+        await asyncio.wait_for(waiter, timeout=0.1)
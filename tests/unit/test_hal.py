@@ -46,6 +46,21 @@ class TestMockGPIO:
         assert states[RelayName.CONDENSER_FAN] is True
         assert states[RelayName.WATER_VALVE] is False
 
+    @pytest.mark.asyncio
+    async def test_set_relays(self, initialized_gpio: MockGPIO) -> None:
+        """set_relays should apply every state in the mapping."""
+        await initialized_gpio.set_relays({
+            RelayName.COMPRESSOR_1: True,
+            RelayName.CONDENSER_FAN: True,
+            RelayName.WATER_VALVE: False,
+        })
+
+        states = await initialized_gpio.get_all_relays()
+
+        assert states[RelayName.COMPRESSOR_1] is True
+        assert states[RelayName.CONDENSER_FAN] is True
+        assert states[RelayName.WATER_VALVE] is False
+
     @pytest.mark.asyncio
     async def test_unknown_relay_raises_error(
         self, mock_gpio: MockGPIO
@@ -87,6 +102,26 @@ class TestMockGPIO:
 
         assert len(changes) == 1
 
+    @pytest.mark.asyncio
+    async def test_set_relays_batch_callback(
+        self, initialized_gpio: MockGPIO
+    ) -> None:
+        """set_relays should report only changed relays in one batch call."""
+        batches: list = []
+        singles: list = []
+
+        initialized_gpio.set_batch_change_callback(lambda changes: batches.append(dict(changes)))
+        initialized_gpio.set_change_callback(lambda relay, state: singles.append(relay))
+
+        await initialized_gpio.set_relays({
+            RelayName.COMPRESSOR_1: True,
+            RelayName.CONDENSER_FAN: True,
+            RelayName.WATER_VALVE: False,
+        })
+
+        assert batches == [{RelayName.COMPRESSOR_1: True, RelayName.CONDENSER_FAN: True}]
+        assert singles == []
+
     @pytest.mark.asyncio
     async def test_cleanup_turns_off_all_relays(
         self, initialized_gpio: MockGPIO